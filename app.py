@@ -1,15 +1,42 @@
 from flask import Flask, render_template, jsonify, request, session, send_file
+from flask.json.provider import DefaultJSONProvider
 import os
-import json
+import re
+import atexit
+import threading
+from collections.abc import Mapping
 from functools import wraps
 from dotenv import load_dotenv
 from contact_list import ContactLinkedList
+from record_registry import RecordRegistry
+from response_cache import ResponseCache, SUPPORTED_ENCODINGS, MIN_COMPRESS_SIZE
+from file_cache import FileCache
+from persistence import WriteBehindWriter
+from shared_versions import SharedVersions
+from lazy_dataset import LazyDataset, BackgroundWarmer
+from file_watcher import FileWatcher
+from citation_graph import CitationGraph
+from dataset_sets import DatasetSets
+from citation_stats import archimedes_stats as compute_archimedes_stats, citation_statistics
+from research_data import (load_archimedes_corpus, load_peterson_corpus, archimedes_source_paths,
+                           peterson_source_paths, ARCHIMEDES_SEEDS, PETERSON_SEEDS)
+from startup import StartupProfile, load_parallel, read_json
+from pagination import parse_field_list, normalize_field_list, project_record, decode_cursor, parse_limit, paginate
 import markdown
 
 # Load environment variables
 load_dotenv()
 
+class MappingJSONProvider(DefaultJSONProvider):
+    """JSON provider that also serializes read-only mappings such as compact Paper records"""
+    @staticmethod
+    def default(o):
+        if isinstance(o, Mapping):
+            return dict(o)
+        return DefaultJSONProvider.default(o)
+
 app = Flask(__name__)
+app.json = MappingJSONProvider(app)
 app.secret_key = os.getenv('SECRET_KEY', os.urandom(24))
 
 # Authentication decorator
@@ -35,148 +62,315 @@ def require_auth(f):
         return f(*args, **kwargs)
     return decorated_function
 
-# Load data from JSON files
-def load_json_data(filename):
-    """Load JSON data from flask_data directory"""
-    filepath = os.path.join(os.path.dirname(__file__), 'flask_data', filename)
-    with open(filepath, 'r') as f:
-        return json.load(f)
-
-# Load projects and publications
-PROJECTS = load_json_data('projects.json')
-PUBLICATIONS = load_json_data('publications.json')
-ABOUT = load_json_data('about.json')
-CONTACT = load_json_data('contact.json')
-NAVIGATION = load_json_data('navigation.json')
-READING_LIST = load_json_data('reading_list.json')
-WRITING = load_json_data('writing.json')
-PODCASTS = load_json_data('podcasts.json')
-
-# Load Archimedes mental rotation research data from mental-rotation-research repository
-ARCHIMEDES_DATASETS = {}
-# Try mental-rotation-research repo first, fallback to Archimedes directory
-mental_rotation_repo = os.path.join(os.path.expanduser('~'), 'mental-rotation-research')
-archimedes_openalex_dir = os.path.join(mental_rotation_repo, 'data', 'archimedes_openalex')
-archimedes_fallback_dir = os.path.join(os.path.expanduser('~'), 'Archimedes')
-
-# Define datasets to load
-# These are citation networks from foundational mental rotation papers
-datasets_to_load = {
-    'overlap_citations': 'overlap_citations_clean.json',  # Papers citing BOTH Shepard & Metzler (1971) AND Vandenberg & Kuse (1978)
-    'shepard_metzler_citations': 'shepard_metzler_1971_citations_clean.json',  # Papers citing Shepard & Metzler (1971)
-    'vandenberg_kuse_citations': 'vandenberg_kuse_1978_citations_clean.json',  # Papers citing Vandenberg & Kuse (1978)
-}
-
-for dataset_name, filename in datasets_to_load.items():
-    try:
-        # Try loading from mental-rotation-research repo first
-        filepath = os.path.join(archimedes_openalex_dir, filename)
-        if not os.path.exists(filepath):
-            # Fallback to Archimedes directory
-            filepath = os.path.join(archimedes_fallback_dir, filename)
-        
-        with open(filepath, 'r') as f:
-            ARCHIMEDES_DATASETS[dataset_name] = json.load(f)
-        print(f"Loaded {len(ARCHIMEDES_DATASETS[dataset_name])} papers from {dataset_name}")
-    except FileNotFoundError:
-        print(f"Warning: {filename} not found in mental-rotation-research or Archimedes directory")
-        ARCHIMEDES_DATASETS[dataset_name] = []
-
-# Create combined dataset (removing duplicates by DOI/title)
-# Filter to only papers published after 1971 (papers that could cite Shepard & Metzler 1971)
-# Exclude medical/clinical papers (pulmonary, radiology, etc.)
-all_papers = []
-seen_identifiers = set()
-
-# Medical concepts to exclude
-medical_exclude_concepts = {
-    'medicine', 'radiology', 'surgery', 'pulmonary', 'clinical', 'medical',
-    'patient', 'disease', 'therapy', 'diagnosis', 'pathology', 'anatomy',
-    'computed tomography', 'ct scan', 'mri', 'imaging', 'radiography',
-    'lung', 'heart', 'vascular', 'organ', 'tissue', 'cancer', 'tumor'
-}
-
-for dataset_name, papers in ARCHIMEDES_DATASETS.items():
-    for paper in papers:
-        # Filter: only papers from 1972 onwards
-        paper_year = paper.get('year')
-        if paper_year and paper_year < 1972:
-            continue
-        
-        # Filter: exclude medical/clinical papers
-        concepts = paper.get('concepts', [])
-        concepts_lower = [c.lower() for c in concepts]
-        if any(med_term in ' '.join(concepts_lower) for med_term in medical_exclude_concepts):
-            continue
-            
-        # Use DOI as primary identifier, fall back to title
-        identifier = paper.get('doi') or paper.get('title')
-        if identifier and identifier not in seen_identifiers:
-            seen_identifiers.add(identifier)
-            # Add dataset source tag
-            paper_copy = paper.copy()
-            paper_copy['source_dataset'] = dataset_name
-            all_papers.append(paper_copy)
-
-ARCHIMEDES_PAPERS = all_papers
-print(f"Total unique papers across all datasets (1972+): {len(ARCHIMEDES_PAPERS)}")
-
-# Load Peterson citation network data
-PETERSON_DATASETS = {}
-petersson_citations_dir = os.path.join(os.path.expanduser('~'), 'Archimedes', 'peterson_citations')
-
-petersson_datasets_to_load = {
-    'peterson_network': 'jordan_peterson_network_cleaned.json',
-    'peterson_papers': 'jordan_peterson_papers_cleaned.json',
-    'maps_of_meaning': 'maps_of_meaning_citations_openalex.json',
-    'maps_of_meaning_curated': 'maps_of_meaning_citations.json'
-}
+# Load data from JSON files (create_app(data_dir=...) points the app elsewhere, e.g. a test copy)
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'flask_data')
 
-for dataset_name, filename in petersson_datasets_to_load.items():
-    try:
-        filepath = os.path.join(petersson_citations_dir, filename)
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-            # Handle both metadata+papers structure and simple papers structure
-            if isinstance(data, dict) and 'papers' in data:
-                PETERSON_DATASETS[dataset_name] = data['papers']
-            else:
-                PETERSON_DATASETS[dataset_name] = data
-        papers_count = len(PETERSON_DATASETS[dataset_name]) if isinstance(PETERSON_DATASETS[dataset_name], list) else 0
-        print(f"Loaded {papers_count} papers from {dataset_name}")
-    except FileNotFoundError:
-        print(f"Warning: {filename} not found in {petersson_citations_dir}")
-        PETERSON_DATASETS[dataset_name] = []
-    except Exception as e:
-        print(f"Error loading {filename}: {e}")
-        PETERSON_DATASETS[dataset_name] = []
+# Mutations are persisted off the request path; flush on shutdown so nothing is lost
+data_writer = WriteBehindWriter(DATA_DIR)
+atexit.register(data_writer.flush, 10)
 
-# Initialize contact microservices linked list
+def load_json_data(filename):
+    """Load JSON data from flask_data directory"""
+    return read_json(os.path.join(DATA_DIR, filename))
+
+# Startup timings (print with: flask --app app startup-profile)
+startup_profile = StartupProfile()
+
+# Site data is loaded by create_app() (concurrently); these are filled in place
+# Collections served by id are wrapped in registries (ordered list + id index)
+PROJECTS = RecordRegistry()
+PUBLICATIONS = []
+ABOUT = {}
+CONTACT = {}
+NAVIGATION = {}
+READING_LIST = RecordRegistry()
+WRITING = RecordRegistry()
+PODCASTS = RecordRegistry()
+CONTACT_RESEARCH = {}
+CONTACT_SPEAKING = {}
+CONTACT_CONSULTING = {}
+CONTACT_COLLABORATION = {}
+
+# Initialize contact microservices linked list (nodes are added as the contact files load)
 contact_services = ContactLinkedList()
 
-# Load and add contact microservices to linked list
-CONTACT_RESEARCH = load_json_data('contact_research.json')
-contact_services.append('research', '/api/contact/research', CONTACT_RESEARCH)
+# flask_data file -> (module global, response cache name, contact service id)
+SITE_DATASETS = {
+    'projects.json': ('PROJECTS', 'projects', None),
+    'publications.json': ('PUBLICATIONS', 'publications', None),
+    'about.json': ('ABOUT', None, None),
+    'contact.json': ('CONTACT', None, None),
+    'navigation.json': ('NAVIGATION', None, None),
+    'reading_list.json': ('READING_LIST', 'reading_list', None),
+    'writing.json': ('WRITING', 'writing', None),
+    'podcasts.json': ('PODCASTS', 'podcasts', None),
+    'contact_research.json': ('CONTACT_RESEARCH', None, 'research'),
+    'contact_speaking.json': ('CONTACT_SPEAKING', None, 'speaking'),
+    'contact_consulting.json': ('CONTACT_CONSULTING', None, 'consulting'),
+    'contact_collaboration.json': ('CONTACT_COLLABORATION', None, 'collaboration'),
+}
 
-CONTACT_SPEAKING = load_json_data('contact_speaking.json')
-contact_services.append('speaking', '/api/contact/speaking', CONTACT_SPEAKING)
+def set_site_dataset(filename, data):
+    """Install freshly loaded data for a flask_data file"""
+    name, cache_name, service_id = SITE_DATASETS[filename]
+    current = globals()[name]
+    if isinstance(current, RecordRegistry):
+        current.replace(data)
+    else:
+        globals()[name] = data
+    if cache_name:
+        response_cache.invalidate(cache_name)
+    if service_id:
+        node = contact_services.get(service_id)
+        if node:
+            node.data = data
+        else:
+            contact_services.append(service_id, f'/api/contact/{service_id}', data)
+
+def load_site_data():
+    """Load every flask_data file concurrently and install them in SITE_DATASETS order"""
+    def timed_load(filename):
+        with startup_profile.phase('parse', filename):
+            return load_json_data(filename)
+    
+    loaded = load_parallel({
+        filename: (lambda f=filename: timed_load(f))
+        for filename in SITE_DATASETS
+    })
+    for filename in SITE_DATASETS:
+        set_site_dataset(filename, loaded[filename])
+
+def warm_templates():
+    """Compile every Jinja template ahead of the first request"""
+    for name in app.jinja_env.list_templates():
+        with startup_profile.phase('template_warmup', name):
+            app.jinja_env.get_template(name)
+
+app_init_lock = threading.Lock()
+
+def create_app(data_dir=None):
+    """Initialize the app: load site data, warm templates and record startup timings
+    
+    Importing this module only defines the app; wsgi.py (`gunicorn wsgi:app`) or
+    `flask --app app:create_app` call this up front, and a server that imports
+    `app:app` directly initializes on its first request. Idempotent.
+    data_dir replaces flask_data as the directory data is read from and written to.
+    """
+    global DATA_DIR, shared_versions
+    if 'startup_profile' in app.extensions:
+        return app
+    with app_init_lock:
+        if 'startup_profile' in app.extensions:
+            return app
+        if data_dir:
+            DATA_DIR = data_dir
+            data_writer.directory = data_dir
+        # Cross-worker data versions, one counter per flask_data file
+        shared_versions = SharedVersions(
+            os.getenv('DATA_VERSION_FILE', os.path.join(DATA_DIR, '.data_versions')),
+            SITE_DATASETS
+        )
+        # Bump a file's version only once it is durably on disk, so other workers reload the new contents
+        data_writer.add_listener(shared_versions.bump)
+        with startup_profile.phase('startup', 'create_app'):
+            load_site_data()
+            warm_templates()
+        app.extensions['startup_profile'] = startup_profile
+    return app
+
+@app.before_request
+def ensure_initialized():
+    """Initialize on the first request if the server imported `app:app` without create_app()"""
+    create_app()
+
+# Research citation datasets are loaded lazily (first use or background warm-up), not at import
+ARCHIMEDES = LazyDataset('archimedes', lambda: load_archimedes_corpus(startup_profile))
+PETERSON = LazyDataset('peterson', lambda: load_peterson_corpus(startup_profile))
+RESEARCH_DATASETS = [ARCHIMEDES, PETERSON]
+dataset_warmer = BackgroundWarmer(RESEARCH_DATASETS)
+
+def archimedes_datasets():
+    """Archimedes citation datasets by name"""
+    return ARCHIMEDES.get()['datasets']
+
+def archimedes_papers():
+    """Combined, deduplicated Archimedes papers"""
+    return ARCHIMEDES.get()['papers']
+
+def archimedes_index():
+    """Search index over the combined Archimedes papers"""
+    return ARCHIMEDES.get()['index']
+
+def archimedes_stats(corpus=None):
+    """Aggregate statistics for the loaded Archimedes corpus, computed once per data version"""
+    corpus = corpus or ARCHIMEDES.get()
+    if 'stats' not in corpus:
+        corpus['stats'] = compute_archimedes_stats(corpus['papers'], corpus['datasets'])
+    return corpus['stats']
+
+def peterson_datasets():
+    """Peterson citation datasets by name"""
+    return PETERSON.get()['datasets']
+
+def peterson_stats():
+    """Citation statistics per Peterson dataset, computed when the datasets were loaded"""
+    return PETERSON.get()['stats']
+
+def peterson_metadata(dataset_name):
+    """Citation statistics metadata for one Peterson dataset"""
+    return peterson_stats().get(dataset_name) or citation_statistics([])
+
+# Structures derived from both research corpora, rebuilt when either dataset's version changes
+research_derived_cache = {}
+research_derived_lock = threading.Lock()
+
+def research_snapshot():
+    """((archimedes version, peterson version), datasets by name) from one consistent load of each"""
+    archimedes_version, archimedes_corpus = ARCHIMEDES.current()
+    peterson_version, peterson_corpus = PETERSON.current()
+    return (archimedes_version, peterson_version), {**archimedes_corpus['datasets'], **peterson_corpus['datasets']}
+
+def research_derived(name, build):
+    """(version, build(datasets)) for the current research data, computed once per version"""
+    version, datasets = research_snapshot()
+    cached = research_derived_cache.get(name)
+    if cached is None or cached[0] != version:
+        with research_derived_lock:
+            cached = research_derived_cache.get(name)
+            if cached is None or cached[0] != version:
+                cached = (version, build(datasets))
+                research_derived_cache[name] = cached
+    return cached
+
+def citation_graph():
+    """(version, citation graph over every research dataset)"""
+    return research_derived(
+        'citation_graph',
+        lambda datasets: CitationGraph.from_datasets(datasets, {**ARCHIMEDES_SEEDS, **PETERSON_SEEDS})
+    )
 
-CONTACT_CONSULTING = load_json_data('contact_consulting.json')
-contact_services.append('consulting', '/api/contact/consulting', CONTACT_CONSULTING)
+def dataset_sets():
+    """(version, research datasets as bitsets over dense paper ids)"""
+    return research_derived('dataset_sets', DatasetSets)
 
-CONTACT_COLLABORATION = load_json_data('contact_collaboration.json')
-contact_services.append('collaboration', '/api/contact/collaboration', CONTACT_COLLABORATION)
+# Hot reload: poll the research source files and rebuild a dataset in the background when they change
+RESEARCH_RESPONSE_CACHES = {
+    'archimedes': ['archimedes_papers', 'archimedes_stats'],
+    'peterson': []
+}
+GRAPH_RESPONSE_CACHES = ['citation_graph', 'citation_graph_degrees']
+
+def reload_research_dataset(dataset):
+    """Rebuild a loaded research dataset and drop responses cached for older versions
+
+    Returns False while the first load is still running (it may have read the
+    old files), so the watcher retries the reload on its next poll.
+    """
+    if dataset.loading:
+        return False
+    if not dataset.ready:
+        return True  # not loaded yet (or failed): the next load reads the new files anyway
+    if dataset.reload():
+        for name in RESEARCH_RESPONSE_CACHES[dataset.name] + GRAPH_RESPONSE_CACHES:
+            response_cache.invalidate(name)
+        print(f"Reloaded research dataset {dataset.name} (version {dataset.version})")
+    return True
+
+research_watcher = FileWatcher(float(os.getenv('RESEARCH_DATA_POLL_SECONDS', '5')))
+research_watcher.watch('archimedes', archimedes_source_paths, lambda: reload_research_dataset(ARCHIMEDES))
+research_watcher.watch('peterson', peterson_source_paths, lambda: reload_research_dataset(PETERSON))
+
+# Cross-worker data versions (opened by create_app, next to the data it tracks)
+shared_versions = None
+
+def reload_dataset(filename):
+    """Reload a flask_data file that another worker changed"""
+    set_site_dataset(filename, load_json_data(filename))
+
+@app.before_request
+def start_dataset_warmup():
+    """Warm research datasets in the background once the worker serves its first request"""
+    dataset_warmer.start()
+    research_watcher.start()
+
+@app.before_request
+def sync_shared_data():
+    """Pick up datasets changed by other workers (one mmap read when nothing changed)"""
+    for filename in shared_versions.changed():
+        try:
+            reload_dataset(filename)
+        except (OSError, ValueError) as e:
+            print(f"Error reloading {filename}: {e}")
+
+# Pre-serialized JSON bodies for the list endpoints (invalidated by the handlers that mutate the data)
+response_cache = ResponseCache()
+
+def serialize_json(data):
+    """Encode data exactly as jsonify would"""
+    return (app.json.dumps(data) + "\n").encode('utf-8')
+
+def cached_json_response(name, get_data, variant=None):
+    """Serve a cached JSON body with a strong ETag, answering If-None-Match with 304
+    
+    Large bodies are sent precompressed (brotli/gzip) according to Accept-Encoding.
+    """
+    entry = response_cache.get(name, lambda: serialize_json(get_data()), variant)
+    encoding = None
+    if len(entry) >= MIN_COMPRESS_SIZE:
+        encoding = request.accept_encodings.best_match(SUPPORTED_ENCODINGS)
+    body, etag = entry.encoded(encoding)
+    
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(body, mimetype='application/json')
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+    response.set_etag(etag)
+    response.vary.add('Accept-Encoding')
+    return response
+
+# Parsed/serialized contents of files served straight from disk, revalidated by mtime/size
+file_cache = FileCache()
+
+def file_response(resource, body, mimetype):
+    """Serve a cached file-backed body with ETag/Last-Modified, answering conditional requests"""
+    response = app.response_class(body, mimetype=mimetype)
+    response.set_etag(resource.etag)
+    response.last_modified = resource.last_modified
+    return response.make_conditional(request)
+
+def wants_ndjson():
+    """True if the client asked for newline-delimited JSON (?stream=1 or Accept: application/x-ndjson)"""
+    if request.args.get('stream') == '1':
+        return True
+    best = request.accept_mimetypes.best_match(['application/json', 'application/x-ndjson'])
+    return best == 'application/x-ndjson'
+
+def ndjson_response(records, transform=None):
+    """Stream records one JSON document per line instead of building one large body"""
+    snapshot = list(records)
+    
+    def generate():
+        for record in snapshot:
+            if transform:
+                record = transform(record)
+            yield app.json.dumps(record) + "\n"
+    
+    response = app.response_class(generate(), mimetype='application/x-ndjson')
+    response.headers['X-Total-Count'] = str(len(snapshot))
+    return response
 
 # API Endpoints
 @app.route("/api/projects")
 def api_projects():
     """Get all projects as JSON"""
-    return jsonify(PROJECTS)
+    return cached_json_response('projects', PROJECTS.to_list)
 
 @app.route("/api/projects/<project_id>")
 def api_project_detail(project_id):
     """Get single project by ID as JSON"""
-    project = next((p for p in PROJECTS if p["id"] == project_id), None)
+    project = PROJECTS.get(project_id)
     if not project:
         return jsonify({"error": "Project not found"}), 404
     return jsonify(project)
@@ -184,7 +378,7 @@ def api_project_detail(project_id):
 @app.route("/api/publications")
 def api_publications():
     """Get all publications as JSON"""
-    return jsonify(PUBLICATIONS)
+    return cached_json_response('publications', lambda: PUBLICATIONS)
 
 @app.route("/api/about")
 def api_about():
@@ -201,15 +395,60 @@ def api_navigation():
     """Get navigation links as JSON"""
     return jsonify(NAVIGATION)
 
+# /api/podcasts shapes served from the response cache (exclude lists, normalized);
+# any other projection is serialized per request so query strings cannot grow the cache
+CACHED_PODCAST_EXCLUDES = {(), ('transcript_segments',), ('transcript', 'transcript_segments')}
+
+def podcast_cache_variant(fields, exclude):
+    """Cache variant for a full podcasts listing, or None if the shape is not cached"""
+    if fields:
+        return None
+    exclude = normalize_field_list(exclude, PODCASTS.fields())
+    return exclude if exclude in CACHED_PODCAST_EXCLUDES else None
+
 @app.route("/api/podcasts")
 def api_podcasts():
-    """Get all podcast episodes with transcripts"""
-    return jsonify(PODCASTS)
+    """Get podcast episodes with transcripts
+    
+    Optional query params:
+        fields=id,title,...                  only return these keys
+        exclude=transcript,transcript_segments  drop these keys
+        limit=N, cursor=<opaque>             paginate (next cursor in X-Next-Cursor header)
+        stream=1 or Accept: application/x-ndjson  stream one episode per line
+    """
+    fields = parse_field_list(request.args.get('fields'))
+    exclude = parse_field_list(request.args.get('exclude'))
+    try:
+        offset = decode_cursor(request.args.get('cursor'))
+        limit = parse_limit(request.args.get('limit'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    if wants_ndjson():
+        page, _ = paginate(PODCASTS.to_list(), offset, limit)
+        return ndjson_response(page, lambda p: project_record(p, fields, exclude))
+    
+    if offset == 0 and limit is None:
+        variant = podcast_cache_variant(fields, exclude)
+        if variant is None:
+            return jsonify([project_record(p, fields, exclude) for p in PODCASTS])
+        return cached_json_response(
+            'podcasts',
+            lambda: [project_record(p, (), variant) for p in PODCASTS],
+            variant=variant
+        )
+    
+    page, next_cursor = paginate(PODCASTS.to_list(), offset, limit)
+    response = jsonify([project_record(p, fields, exclude) for p in page])
+    response.headers['X-Total-Count'] = str(len(PODCASTS))
+    if next_cursor:
+        response.headers['X-Next-Cursor'] = next_cursor
+    return response
 
 @app.route("/api/podcasts/<podcast_id>")
 def api_podcast_detail(podcast_id):
     """Get single podcast episode by ID"""
-    podcast = next((p for p in PODCASTS if p["id"] == podcast_id), None)
+    podcast = PODCASTS.get(podcast_id)
     if not podcast:
         return jsonify({"error": "Podcast not found"}), 404
     return jsonify(podcast)
@@ -218,11 +457,11 @@ def api_podcast_detail(podcast_id):
 @app.route("/api/writing")
 def api_writing_list():
     """Get list of writing samples"""
-    return jsonify(WRITING)
+    return cached_json_response('writing', WRITING.to_list)
 
 @app.route("/api/writing/<post_id>")
 def api_writing_detail(post_id):
-    post = next((w for w in WRITING if w["id"] == post_id), None)
+    post = WRITING.get(post_id)
     if not post:
         return jsonify({"error": "Writing sample not found"}), 404
     return jsonify(post)
@@ -244,13 +483,12 @@ def api_writing_upload():
     slug = title.lower().replace(' ', '-').replace('/', '-').replace("'", "")
     idx = 1
     base_slug = slug or 'writing'
-    existing_ids = {w['id'] for w in WRITING}
-    while slug in existing_ids:
+    while slug in WRITING:
         idx += 1
         slug = f"{base_slug}-{idx}"
 
     # Save file into flask_data/writing_files/
-    files_dir = os.path.join(os.path.dirname(__file__), 'flask_data', 'writing_files')
+    files_dir = os.path.join(DATA_DIR, 'writing_files')
     os.makedirs(files_dir, exist_ok=True)
     filepath = os.path.join(files_dir, f"{slug}.txt")
     file.save(filepath)
@@ -272,11 +510,10 @@ def api_writing_upload():
         'text': text
     }
 
-    # Update in-memory and persist
+    # Update in-memory and persist (write-behind)
     WRITING.append(new_post)
-    outpath = os.path.join(os.path.dirname(__file__), 'flask_data', 'writing.json')
-    with open(outpath, 'w') as f:
-        json.dump(WRITING, f, indent=2)
+    response_cache.invalidate('writing')
+    data_writer.schedule('writing.json', WRITING.to_list)
 
     return jsonify({"message": "Writing uploaded", "id": slug}), 201
 
@@ -286,7 +523,7 @@ def writing_list_page():
 
 @app.route("/writing/<post_id>")
 def writing_detail_page(post_id):
-    post = next((w for w in WRITING if w["id"] == post_id), None)
+    post = WRITING.get(post_id)
     if not post:
         return "Writing sample not found", 404
     return render_template("writing_detail.html", post=post)
@@ -299,7 +536,7 @@ def nav_component():
 @app.route("/api/reading-list")
 def api_reading_list():
     """Get all reading list items"""
-    return jsonify(READING_LIST)
+    return cached_json_response('reading_list', READING_LIST.to_list)
 
 @app.route("/api/reading-list/add", methods=['POST'])
 @require_auth
@@ -313,7 +550,7 @@ def api_reading_list_add():
         return jsonify({"error": "Missing required fields: title, categories"}), 400
     
     # Generate ID
-    new_id = max([item['id'] for item in READING_LIST], default=0) + 1
+    new_id = max(READING_LIST.ids(), default=0) + 1
     
     # Create new item
     new_item = {
@@ -326,11 +563,10 @@ def api_reading_list_add():
     }
     
     READING_LIST.append(new_item)
+    response_cache.invalidate('reading_list')
     
-    # Save to JSON file
-    filepath = os.path.join(os.path.dirname(__file__), 'flask_data', 'reading_list.json')
-    with open(filepath, 'w') as f:
-        json.dump(READING_LIST, f, indent=2)
+    # Persist to JSON file (write-behind)
+    data_writer.schedule('reading_list.json', READING_LIST.to_list)
     
     return jsonify({
         "message": "Item added successfully",
@@ -345,7 +581,7 @@ def api_reading_list_update(item_id):
     data = request.get_json()
     
     # Find the item
-    item = next((i for i in READING_LIST if i['id'] == item_id), None)
+    item = READING_LIST.get(item_id)
     if not item:
         return jsonify({"error": "Item not found"}), 404
     
@@ -360,11 +596,10 @@ def api_reading_list_update(item_id):
         item['categories'] = data['categories']
     if 'status' in data:
         item['status'] = data['status']
+    response_cache.invalidate('reading_list')
     
-    # Save to JSON file
-    filepath = os.path.join(os.path.dirname(__file__), 'flask_data', 'reading_list.json')
-    with open(filepath, 'w') as f:
-        json.dump(READING_LIST, f, indent=2)
+    # Persist to JSON file (write-behind)
+    data_writer.schedule('reading_list.json', READING_LIST.to_list)
     
     return jsonify({
         "message": "Item updated successfully",
@@ -423,19 +658,14 @@ def api_contact_add():
 @require_auth
 def api_project_delete(project_id):
     """Delete a project by ID"""
-    global PROJECTS
-    
     # Find and remove the project
-    project = next((p for p in PROJECTS if p['id'] == project_id), None)
+    project = PROJECTS.remove(project_id)
     if not project:
         return jsonify({"error": "Project not found"}), 404
+    response_cache.invalidate('projects')
     
-    PROJECTS = [p for p in PROJECTS if p['id'] != project_id]
-    
-    # Save to JSON file
-    filepath = os.path.join(os.path.dirname(__file__), 'flask_data', 'projects.json')
-    with open(filepath, 'w') as f:
-        json.dump(PROJECTS, f, indent=2)
+    # Persist to JSON file (write-behind)
+    data_writer.schedule('projects.json', PROJECTS.to_list)
     
     return jsonify({
         "message": "Project deleted successfully",
@@ -447,16 +677,14 @@ def api_project_delete(project_id):
 @require_auth
 def api_projects_populate():
     """Populate/replace projects data"""
-    global PROJECTS
     data = request.get_json()
     
     if not isinstance(data, list):
         return jsonify({"error": "Data must be an array of projects"}), 400
     
-    PROJECTS = data
-    filepath = os.path.join(os.path.dirname(__file__), 'flask_data', 'projects.json')
-    with open(filepath, 'w') as f:
-        json.dump(PROJECTS, f, indent=2)
+    PROJECTS.replace(data)
+    response_cache.invalidate('projects')
+    data_writer.schedule('projects.json', PROJECTS.to_list)
     
     return jsonify({
         "message": "Projects populated successfully",
@@ -474,9 +702,8 @@ def api_publications_populate():
         return jsonify({"error": "Data must be an array of publications"}), 400
     
     PUBLICATIONS = data
-    filepath = os.path.join(os.path.dirname(__file__), 'flask_data', 'publications.json')
-    with open(filepath, 'w') as f:
-        json.dump(PUBLICATIONS, f, indent=2)
+    response_cache.invalidate('publications')
+    data_writer.schedule('publications.json', lambda: PUBLICATIONS)
     
     return jsonify({
         "message": "Publications populated successfully",
@@ -494,9 +721,7 @@ def api_about_populate():
         return jsonify({"error": "Data must be an object"}), 400
     
     ABOUT = data
-    filepath = os.path.join(os.path.dirname(__file__), 'flask_data', 'about.json')
-    with open(filepath, 'w') as f:
-        json.dump(ABOUT, f, indent=2)
+    data_writer.schedule('about.json', lambda: ABOUT)
     
     return jsonify({
         "message": "About page populated successfully"
@@ -513,9 +738,7 @@ def api_contact_populate():
         return jsonify({"error": "Data must be an object"}), 400
     
     CONTACT = data
-    filepath = os.path.join(os.path.dirname(__file__), 'flask_data', 'contact.json')
-    with open(filepath, 'w') as f:
-        json.dump(CONTACT, f, indent=2)
+    data_writer.schedule('contact.json', lambda: CONTACT)
     
     return jsonify({
         "message": "Contact page populated successfully"
@@ -532,9 +755,7 @@ def api_navigation_populate():
         return jsonify({"error": "Data must be an object"}), 400
     
     NAVIGATION = data
-    filepath = os.path.join(os.path.dirname(__file__), 'flask_data', 'navigation.json')
-    with open(filepath, 'w') as f:
-        json.dump(NAVIGATION, f, indent=2)
+    data_writer.schedule('navigation.json', lambda: NAVIGATION)
     
     return jsonify({
         "message": "Navigation populated successfully"
@@ -551,9 +772,7 @@ def api_contact_research_populate():
         return jsonify({"error": "Data must be an object"}), 400
     
     CONTACT_RESEARCH = data
-    filepath = os.path.join(os.path.dirname(__file__), 'flask_data', 'contact_research.json')
-    with open(filepath, 'w') as f:
-        json.dump(CONTACT_RESEARCH, f, indent=2)
+    data_writer.schedule('contact_research.json', lambda: CONTACT_RESEARCH)
     
     # Update linked list
     node = contact_services.get('research')
@@ -575,9 +794,7 @@ def api_contact_speaking_populate():
         return jsonify({"error": "Data must be an object"}), 400
     
     CONTACT_SPEAKING = data
-    filepath = os.path.join(os.path.dirname(__file__), 'flask_data', 'contact_speaking.json')
-    with open(filepath, 'w') as f:
-        json.dump(CONTACT_SPEAKING, f, indent=2)
+    data_writer.schedule('contact_speaking.json', lambda: CONTACT_SPEAKING)
     
     # Update linked list
     node = contact_services.get('speaking')
@@ -599,9 +816,7 @@ def api_contact_consulting_populate():
         return jsonify({"error": "Data must be an object"}), 400
     
     CONTACT_CONSULTING = data
-    filepath = os.path.join(os.path.dirname(__file__), 'flask_data', 'contact_consulting.json')
-    with open(filepath, 'w') as f:
-        json.dump(CONTACT_CONSULTING, f, indent=2)
+    data_writer.schedule('contact_consulting.json', lambda: CONTACT_CONSULTING)
     
     # Update linked list
     node = contact_services.get('consulting')
@@ -623,9 +838,7 @@ def api_contact_collaboration_populate():
         return jsonify({"error": "Data must be an object"}), 400
     
     CONTACT_COLLABORATION = data
-    filepath = os.path.join(os.path.dirname(__file__), 'flask_data', 'contact_collaboration.json')
-    with open(filepath, 'w') as f:
-        json.dump(CONTACT_COLLABORATION, f, indent=2)
+    data_writer.schedule('contact_collaboration.json', lambda: CONTACT_COLLABORATION)
     
     # Update linked list
     node = contact_services.get('collaboration')
@@ -676,7 +889,7 @@ def contact_service(service_id):
 
 @app.route("/project/<project_id>")
 def project_detail(project_id):
-    project = next((p for p in PROJECTS if p["id"] == project_id), None)
+    project = PROJECTS.get(project_id)
     if not project:
         return "Project not found", 404
     return render_template("project.html", project=project)
@@ -695,13 +908,18 @@ def reading():
 
 @app.route("/archimedes")
 def archimedes():
-    """Archimedes mental rotation research dashboard"""
-    return render_template("archimedes.html", papers=ARCHIMEDES_PAPERS)
+    """Archimedes mental rotation research dashboard (papers are fetched page by page)"""
+    return render_template("archimedes.html", stats=archimedes_stats())
+
+@app.route("/archimedes/search")
+def archimedes_search():
+    """Paper search backing the public Archimedes page (same params as /api/archimedes/papers)"""
+    return archimedes_search_response()
 
 @app.route("/archimedes/dashboard")
 def archimedes_dashboard():
     """Archimedes visualization dashboard"""
-    return render_template("archimedes_dashboard.html")
+    return render_template("archimedes_dashboard.html", stats=archimedes_stats())
 
 @app.route("/resume")
 def resume():
@@ -721,6 +939,20 @@ def validate_resume_code():
     else:
         return jsonify({"success": False, "error": "Invalid code"}), 403
 
+RESUME_BODY_PATTERN = re.compile(r'<body>(.*?)</body>', re.DOTALL)
+
+def load_resume_content(filepath):
+    """Extract the resume <body> fragment and serialize its JSON envelope once"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        html_content = f.read()
+    
+    # Extract content between <body> and </body> tags
+    body_match = RESUME_BODY_PATTERN.search(html_content)
+    if body_match:
+        html_content = body_match.group(1)
+    
+    return serialize_json({"content": html_content})
+
 @app.route("/api/resume/content")
 def resume_content():
     """Get resume content (requires session authentication via code validation)"""
@@ -728,41 +960,95 @@ def resume_content():
     if not session.get('resume_access'):
         return jsonify({"error": "Access code required"}), 403
     
-    # Read resume_modular.html content (extract body content only)
+    # Extracted body is cached until resume_modular.html changes
     filepath = os.path.join(os.path.dirname(__file__), 'resume_modular.html')
-    with open(filepath, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-    
-    # Extract content between <body> and </body> tags
-    import re
-    body_match = re.search(r'<body>(.*?)</body>', html_content, re.DOTALL)
-    if body_match:
-        html_content = body_match.group(1)
-    else:
-        # If no body tags found, use the full content
-        html_content = html_content
-    
-    return jsonify({"content": html_content}), 200
+    resource = file_cache.get(filepath, load_resume_content)
+    return file_response(resource, resource.data, 'application/json')
+
+ARCHIMEDES_SEARCH_PARAMS = ('q', 'year_from', 'year_to', 'dataset', 'concept', 'sort', 'order',
+                            'limit', 'cursor', 'fields', 'exclude')
+
+def parse_year(name):
+    value = request.args.get(name)
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer")
+
+def archimedes_search_response():
+    """Search, filter, sort and paginate the Archimedes papers from the request args"""
+    fields = parse_field_list(request.args.get('fields'))
+    exclude = parse_field_list(request.args.get('exclude'))
+    order = request.args.get('order', 'desc')
+    try:
+        if order not in ('asc', 'desc'):
+            raise ValueError("order must be asc or desc")
+        offset = decode_cursor(request.args.get('cursor'))
+        limit = parse_limit(request.args.get('limit'))
+        matches = archimedes_index().search(
+            q=request.args.get('q'),
+            year_from=parse_year('year_from'),
+            year_to=parse_year('year_to'),
+            dataset=request.args.get('dataset'),
+            concept=request.args.get('concept'),
+            sort=request.args.get('sort') or None,
+            descending=order == 'desc'
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    page, next_cursor = paginate(matches, offset, limit)
+    if wants_ndjson():
+        return ndjson_response(page, lambda p: project_record(p, fields, exclude))
+    response = jsonify([project_record(p, fields, exclude) for p in page])
+    response.headers['X-Total-Count'] = str(len(matches))
+    if next_cursor:
+        response.headers['X-Next-Cursor'] = next_cursor
+    return response
 
 @app.route("/api/archimedes/papers")
 @require_auth
 def api_archimedes_papers():
-    """Get all mental rotation research papers (combined, deduplicated)"""
-    return jsonify(ARCHIMEDES_PAPERS)
+    """Get mental rotation research papers (combined, deduplicated)
+    
+    Optional query params:
+        q=words                      every word must prefix-match the title, abstract, concepts, authors or journal
+        year_from=YYYY, year_to=YYYY inclusive publication year range
+        dataset=name, concept=name   restrict to a source dataset / OpenAlex concept
+        sort=cited_by_count|year|title, order=desc|asc
+        limit=N, cursor=<opaque>     paginate (next cursor in X-Next-Cursor header)
+        fields=..., exclude=...      project each paper
+    """
+    if any(param in request.args for param in ARCHIMEDES_SEARCH_PARAMS):
+        return archimedes_search_response()
+    version, corpus = ARCHIMEDES.current()
+    if wants_ndjson():
+        return ndjson_response(corpus['papers'])
+    return cached_json_response('archimedes_papers', lambda: corpus['papers'], variant=version)
+
+@app.route("/api/archimedes/stats")
+@require_auth
+def api_archimedes_stats():
+    """Aggregate statistics: citations per year, percentiles, top cited, dataset overlaps, concepts"""
+    version, corpus = ARCHIMEDES.current()
+    return cached_json_response('archimedes_stats', lambda: archimedes_stats(corpus), variant=version)
 
 @app.route("/api/archimedes/datasets")
 @require_auth
 def api_archimedes_datasets():
     """Get list of available datasets with counts"""
+    corpus = ARCHIMEDES.get()
     dataset_info = {
         name: {
             'count': len(papers),
             'name': name.replace('_', ' ').title()
         }
-        for name, papers in ARCHIMEDES_DATASETS.items()
+        for name, papers in corpus['datasets'].items()
     }
     dataset_info['all_papers'] = {
-        'count': len(ARCHIMEDES_PAPERS),
+        'count': len(corpus['papers']),
         'name': 'All Papers (Deduplicated)'
     }
     return jsonify(dataset_info)
@@ -771,64 +1057,182 @@ def api_archimedes_datasets():
 @require_auth
 def api_archimedes_dataset(dataset_name):
     """Get papers from a specific dataset"""
-    if dataset_name not in ARCHIMEDES_DATASETS:
+    datasets = archimedes_datasets()
+    if dataset_name not in datasets:
         return jsonify({"error": "Dataset not found"}), 404
-    return jsonify(ARCHIMEDES_DATASETS[dataset_name])
+    if wants_ndjson():
+        return ndjson_response(datasets[dataset_name])
+    return jsonify(datasets[dataset_name])
+
+# Citation graph API Routes
+def parse_graph_limit(default=20):
+    return parse_limit(request.args.get('limit')) or default
+
+@app.route("/api/archimedes/graph")
+@require_auth
+def api_citation_graph():
+    """Citation graph size: nodes, edges, seed works and weakly connected components"""
+    version, graph = citation_graph()
+    return cached_json_response('citation_graph', graph.summary, variant=version)
+
+@app.route("/api/archimedes/graph/degrees")
+@require_auth
+def api_citation_graph_degrees():
+    """In-degree (times cited) and out-degree (references) distributions"""
+    version, graph = citation_graph()
+    return cached_json_response('citation_graph_degrees', lambda: graph.degree_distributions, variant=version)
+
+@app.route("/api/archimedes/graph/pagerank")
+@require_auth
+def api_citation_graph_pagerank():
+    """Nodes with the highest PageRank (?limit=N, default 20)"""
+    try:
+        limit = parse_graph_limit()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    # The ranking is computed once per graph; only the slice is serialized per request
+    _, graph = citation_graph()
+    return jsonify(graph.top_pagerank(limit))
+
+@app.route("/api/archimedes/graph/components")
+@require_auth
+def api_citation_graph_components():
+    """Weakly connected component count and the largest components (?limit=N, default 20)"""
+    try:
+        limit = parse_graph_limit()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    _, graph = citation_graph()
+    return jsonify(graph.components(limit))
+
+@app.route("/api/archimedes/graph/neighborhood")
+@require_auth
+def api_citation_graph_neighborhood():
+    """Nodes within k hops of a node
+    
+    Query params:
+        node=<OpenAlex id, DOI or title>  (seed works: seed:<label>)
+        k=1..3                            hops (default 1)
+        direction=both|in|out             in = citing papers, out = cited works
+        limit=N                           nodes returned (default 500)
+    """
+    node = request.args.get('node')
+    direction = request.args.get('direction', 'both')
+    try:
+        hops = int(request.args.get('k', 1))
+        limit = parse_graph_limit(default=500)
+        if not node:
+            raise ValueError("node is required")
+        if not 1 <= hops <= 3:
+            raise ValueError("k must be between 1 and 3")
+        if direction not in ('both', 'in', 'out'):
+            raise ValueError("direction must be both, in or out")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    try:
+        _, graph = citation_graph()
+        return jsonify(graph.neighborhood(node, hops, direction, limit))
+    except KeyError:
+        return jsonify({"error": "Node not found"}), 404
+
+@app.route("/api/archimedes/sets")
+@require_auth
+def api_dataset_sets():
+    """Set algebra over citation datasets (papers matched by DOI, else title)
+    
+    Query params:
+        op=intersection|union|difference   difference = first dataset minus the rest
+        datasets=a,b,...                   any Archimedes or Peterson dataset names
+        limit=N, cursor=<opaque>           paginate (total in X-Total-Count, next cursor in X-Next-Cursor)
+        fields=..., exclude=...            project each paper
+    Without params, lists the datasets and their distinct paper counts.
+    """
+    _, sets = dataset_sets()
+    names = parse_field_list(request.args.get('datasets'))
+    if not names and 'op' not in request.args:
+        return jsonify(sets.counts())
+    
+    fields = parse_field_list(request.args.get('fields'))
+    exclude = parse_field_list(request.args.get('exclude'))
+    try:
+        offset = decode_cursor(request.args.get('cursor'))
+        limit = parse_limit(request.args.get('limit'))
+        bitset = sets.evaluate(request.args.get('op', 'intersection'), names)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except KeyError as e:
+        return jsonify({"error": f"Dataset not found: {e.args[0]}"}), 404
+    
+    positions, next_cursor = paginate(sets.positions(bitset), offset, limit)
+    response = jsonify([project_record(p, fields, exclude) for p in sets.papers(positions)])
+    response.headers['X-Total-Count'] = str(bitset.bit_count())
+    if next_cursor:
+        response.headers['X-Next-Cursor'] = next_cursor
+    return response
 
 # Peterson Citation Network API Routes
 @app.route("/api/archimedes/peterson/network")
 @require_auth
 def api_peterson_network():
     """Get Jordan Peterson citation network (cleaned, realistic statistics)"""
+    papers = peterson_datasets().get('peterson_network', [])
     return jsonify({
         "metadata": {
             "description": "Jordan B. Peterson citation network with false positives removed",
-            "total_papers": len(PETERSON_DATASETS.get('peterson_network', [])),
             "note": "Cleaned to remove methodology papers and false positives",
-            "average_citations": 1104,
-            "median_citations": 34
+            **peterson_metadata('peterson_network')
         },
-        "papers": PETERSON_DATASETS.get('peterson_network', [])
+        "papers": papers
     })
 
 @app.route("/api/archimedes/peterson/papers")
 @require_auth
 def api_peterson_papers():
     """Get verified Peterson authored papers"""
+    papers = peterson_datasets().get('peterson_papers', [])
     return jsonify({
         "metadata": {
             "description": "Papers with Jordan B. Peterson as author",
-            "total_papers": len(PETERSON_DATASETS.get('peterson_papers', [])),
-            "note": "Only 1 confirmed Peterson paper found in OpenAlex: goal-setting intervention study (2015)"
+            "note": "Only 1 confirmed Peterson paper found in OpenAlex: goal-setting intervention study (2015)",
+            **peterson_metadata('peterson_papers')
         },
-        "papers": PETERSON_DATASETS.get('peterson_papers', [])
+        "papers": papers
     })
 
 @app.route("/api/archimedes/peterson/maps-of-meaning")
 @require_auth
 def api_maps_of_meaning():
     """Get papers related to Maps of Meaning: The Architecture of Belief (1999)"""
+    papers = peterson_datasets().get('maps_of_meaning_curated', [])
     return jsonify({
         "metadata": {
             "description": "Papers citing or related to Jordan Peterson's Maps of Meaning",
-            "total_papers": len(PETERSON_DATASETS.get('maps_of_meaning_curated', [])),
-            "subject": "Meaning-making, mythology, psychology, archetypal theory"
+            "subject": "Meaning-making, mythology, psychology, archetypal theory",
+            **peterson_metadata('maps_of_meaning_curated')
         },
-        "papers": PETERSON_DATASETS.get('maps_of_meaning_curated', [])
+        "papers": papers
     })
 
 @app.route("/api/archimedes/peterson/citations")
 @require_auth
 def api_peterson_citations():
     """Get all Peterson-related citations and datasets"""
+    datasets = peterson_datasets()
     return jsonify({
         "metadata": {
             "description": "Jordan B. Peterson citation network and related datasets",
             "datasets": {
-                "peterson_network": len(PETERSON_DATASETS.get('peterson_network', [])),
-                "peterson_papers": len(PETERSON_DATASETS.get('peterson_papers', [])),
-                "maps_of_meaning": len(PETERSON_DATASETS.get('maps_of_meaning', [])),
-                "maps_of_meaning_curated": len(PETERSON_DATASETS.get('maps_of_meaning_curated', []))
+                "peterson_network": len(datasets.get('peterson_network', [])),
+                "peterson_papers": len(datasets.get('peterson_papers', [])),
+                "maps_of_meaning": len(datasets.get('maps_of_meaning', [])),
+                "maps_of_meaning_curated": len(datasets.get('maps_of_meaning_curated', []))
+            },
+            "statistics": {
+                name: {
+                    key: stats[key]
+                    for key in ('total_papers', 'total_citations', 'average_citations', 'median_citations', 'h_index')
+                }
+                for name, stats in peterson_stats().items()
             }
         },
         "endpoints": {
@@ -841,13 +1245,25 @@ def api_peterson_citations():
 @app.route("/archimedes/peterson")
 def archimedes_peterson():
     """Peterson citations dashboard"""
+    datasets = peterson_datasets()
     return render_template(
         "archimedes_peterson.html",
-        peterson_network=PETERSON_DATASETS.get('peterson_network', []),
-        maps_of_meaning=PETERSON_DATASETS.get('maps_of_meaning_curated', [])
+        peterson_network=datasets.get('peterson_network', []),
+        maps_of_meaning=datasets.get('maps_of_meaning_curated', [])
     )
 
 # Project Gorgon: Peterson Podcast Episodes
+def load_gorgon_podcasts(filepath):
+    """Load the Gorgon episode list and serialize its response envelope once"""
+    episodes = read_json(filepath)
+    
+    return serialize_json({
+        "project": "GORGON",
+        "description": "Peterson podcast episode URLs for transcript analysis",
+        "total_episodes": len(episodes),
+        "episodes": episodes
+    })
+
 @app.route("/gorgon/peterson-podcasts.json")
 def gorgon_peterson_podcasts():
     """Password-protected Peterson podcast episode list (Project Gorgon)"""
@@ -861,16 +1277,9 @@ def gorgon_peterson_podcasts():
             "hint": "Use ?password=YOUR_PASSWORD or X-Gorgon-Password header"
         }), 403
     
-    filepath = os.path.join(os.path.dirname(__file__), 'flask_data', 'peterson-podcasts.json')
-    with open(filepath, 'r') as f:
-        episodes = json.load(f)
-    
-    return jsonify({
-        "project": "GORGON",
-        "description": "Peterson podcast episode URLs for transcript analysis",
-        "total_episodes": len(episodes),
-        "episodes": episodes
-    })
+    filepath = os.path.join(DATA_DIR, 'peterson-podcasts.json')
+    resource = file_cache.get(filepath, load_gorgon_podcasts)
+    return file_response(resource, resource.data, 'application/json')
 
 @app.route("/gorgon/peterson-basic-stats")
 def gorgon_peterson_stats():
@@ -881,9 +1290,9 @@ def gorgon_peterson_stats():
     if password != correct_password:
         return "<html><body style='background:#0a0a0a;color:#e0e0e0;font-family:monospace;padding:40px;'><h1>🔒 Access Denied</h1><p>Valid password required. Use ?password=YOUR_PASSWORD</p></body></html>", 403
     
-    filepath = os.path.join(os.path.dirname(__file__), 'flask_data', 'peterson-stats.html')
-    with open(filepath, 'r') as f:
-        return f.read()
+    filepath = os.path.join(DATA_DIR, 'peterson-stats.html')
+    resource = file_cache.get(filepath)
+    return file_response(resource, resource.data, 'text/html')
 
 @app.route("/gorgon/resume.pdf")
 def gorgon_resume_pdf():
@@ -895,10 +1304,21 @@ def gorgon_resume_pdf():
         return "<html><body style='background:#0a0a0a;color:#e0e0e0;font-family:monospace;padding:40px;'><h1>🔒 Access Denied</h1><p>Valid password required. Use ?password=YOUR_PASSWORD</p></body></html>", 403
     
     filepath = os.path.join(os.path.dirname(__file__), 'resume.pdf')
-    if not os.path.exists(filepath):
+    try:
+        resource = file_cache.stat(filepath)
+    except FileNotFoundError:
         return "<html><body style='background:#0a0a0a;color:#e0e0e0;font-family:monospace;padding:40px;'><h1>⚠️ Resume Not Found</h1><p>Run 'python generate_resume_pdf.py' to generate resume.pdf</p></body></html>", 404
     
-    return send_file(filepath, mimetype='application/pdf', as_attachment=False, download_name='resume.pdf')
+    # Conditional send_file also answers Range requests
+    return send_file(
+        filepath,
+        mimetype='application/pdf',
+        as_attachment=False,
+        download_name='resume.pdf',
+        conditional=True,
+        etag=resource.etag,
+        last_modified=resource.last_modified
+    )
 
 @app.route("/gorgon/project-proposal")
 def gorgon_project_proposal():
@@ -915,6 +1335,21 @@ def gorgon_project_proposal():
 def healthz():
     return {"ok": True}
 
+@app.route("/readyz")
+def readyz():
+    """Readiness: per-dataset load state and timings (503 until every dataset is loaded)"""
+    datasets = {dataset.name: dataset.status() for dataset in RESEARCH_DATASETS}
+    ready = all(dataset.ready for dataset in RESEARCH_DATASETS)
+    return jsonify({"ready": ready, "datasets": datasets}), 200 if ready else 503
+
+@app.cli.command('startup-profile')
+def startup_profile_command():
+    """Print startup timings, including a full load of the research datasets"""
+    create_app()
+    for dataset in RESEARCH_DATASETS:
+        dataset.get()
+    print(startup_profile.report())
+
 # Error Handlers
 @app.errorhandler(404)
 def page_not_found(e):
@@ -927,4 +1362,4 @@ def internal_server_error(e):
     return render_template("500.html"), 500
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5001, debug=True)
+    create_app().run(host="0.0.0.0", port=5001, debug=True)
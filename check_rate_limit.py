@@ -19,6 +19,14 @@ import argparse
 from datetime import datetime
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
+from rate_limit import classify_fetch_error
+
+ERROR_TYPES = {
+    "disabled": "TranscriptsDisabled",
+    "not_found": "NoTranscriptFound",
+    "ip_blocked": "IP_BLOCKED",
+    "failed": "RETRIEVAL_FAILED",
+}
 
 
 def load_test_videos(count=5):
@@ -79,17 +87,9 @@ def test_single_video(youtube_id, attempt_num):
     except Exception as e:
         error_str = str(e)
         
-        # Categorize error
-        if "Could not retrieve a transcript" in error_str:
-            if "blocking requests from your IP" in error_str:
-                error_type = "IP_BLOCKED"
-                status = "ip_blocked"
-            else:
-                error_type = "RETRIEVAL_FAILED"
-                status = "failed"
-        else:
-            error_type = "UNKNOWN"
-            status = "error"
+        # Categorize error (same categories the fetchers' rate controller uses)
+        status = classify_fetch_error(e)
+        error_type = ERROR_TYPES.get(status, "UNKNOWN")
         
         result.update({
             "status": status,
@@ -0,0 +1,243 @@
+"""
+In-memory citation graph over the OpenAlex citation datasets
+Papers (and the seed works each dataset cites) get dense integer node ids and
+citing -> cited edges are stored as compressed sparse row (CSR) adjacency in
+both directions. Degree, PageRank, component and k-hop queries are vectorized
+NumPy operations over those arrays; whole-graph results are computed once per
+graph and reused.
+"""
+from collections.abc import Mapping
+from functools import cached_property
+
+import numpy as np
+
+SEED_PREFIX = 'seed:'
+# Longest ranking any request can ask for (the API's maximum ?limit=)
+MAX_RANKED = 1000
+
+
+def paper_key(paper):
+    """Stable node key for a paper: OpenAlex id, else DOI, else title"""
+    key = paper.get('id') or paper.get('doi') or paper.get('title')
+    return str(key).strip().lower() if key else None
+
+
+def build_csr(src, dst, n):
+    """CSR (indptr, indices) of the edges src -> dst over n nodes"""
+    order = np.lexsort((dst, src))
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    return indptr, dst[order]
+
+
+def gather_neighbors(indptr, indices, nodes):
+    """Concatenated adjacency lists of nodes (vectorized CSR row gather)"""
+    starts = indptr[nodes]
+    lengths = indptr[nodes + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=indices.dtype)
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return indices[offsets + np.arange(total)]
+
+
+class CitationGraph:
+    """Directed citation graph (citing -> cited) with CSR adjacency"""
+    def __init__(self, keys, nodes, src, dst):
+        self.keys = keys
+        self.nodes = nodes
+        self.ids = {key: i for i, key in enumerate(keys)}
+        n = len(keys)
+        self.out_indptr, self.out_indices = build_csr(src, dst, n)
+        self.in_indptr, self.in_indices = build_csr(dst, src, n)
+        # Edge list in CSR order, for per-edge vectorized passes
+        self.src = np.repeat(np.arange(n, dtype=np.int64), np.diff(self.out_indptr))
+        self.dst = self.out_indices
+
+    @classmethod
+    def from_datasets(cls, datasets, seeds=None):
+        """Build the graph from {dataset: papers}
+
+        Every paper in a dataset cites that dataset's seed works (seeds maps a
+        dataset name to seed labels); OpenAlex referenced_works add edges to
+        any referenced paper that is also in the graph.
+        """
+        seeds = seeds or {}
+        keys, nodes, ids = [], [], {}
+        edges = []
+
+        def node_id(key, attributes):
+            if key not in ids:
+                ids[key] = len(keys)
+                keys.append(key)
+                nodes.append({**attributes, 'datasets': []})
+            return ids[key]
+
+        cited_works = []
+        for dataset_name, papers in datasets.items():
+            if not isinstance(papers, list):
+                continue
+            seed_ids = [
+                node_id(SEED_PREFIX + label.lower(), {'title': label, 'year': None, 'kind': 'seed'})
+                for label in seeds.get(dataset_name, ())
+            ]
+            for paper in papers:
+                key = paper_key(paper) if isinstance(paper, Mapping) else None
+                if not key:
+                    continue
+                i = node_id(key, {'title': paper.get('title'), 'year': paper.get('year'), 'kind': 'paper'})
+                if dataset_name not in nodes[i]['datasets']:
+                    nodes[i]['datasets'].append(dataset_name)
+                edges.extend((i, seed) for seed in seed_ids)
+                for work in paper.get('referenced_works') or ():
+                    cited_works.append((i, str(work).strip().lower()))
+
+        edges.extend((i, ids[work]) for i, work in cited_works if work in ids)
+
+        # Deduplicate edges as single int64 codes (src * n + dst), dropping self-citations
+        n = len(keys)
+        pairs = np.array(edges, dtype=np.int64).reshape(-1, 2)
+        codes = np.unique(pairs[:, 0] * n + pairs[:, 1])
+        src, dst = np.divmod(codes, n) if n else (codes, codes)
+        keep = src != dst
+        return cls(keys, nodes, src[keep], dst[keep])
+
+    @property
+    def node_count(self):
+        return len(self.keys)
+
+    @property
+    def edge_count(self):
+        return len(self.dst)
+
+    def node(self, i, **extra):
+        """JSON description of node i"""
+        return {'id': self.keys[i], **self.nodes[i], **extra}
+
+    @cached_property
+    def in_degrees(self):
+        return np.diff(self.in_indptr)
+
+    @cached_property
+    def out_degrees(self):
+        return np.diff(self.out_indptr)
+
+    @staticmethod
+    def _distribution(degrees):
+        counts = np.bincount(degrees) if len(degrees) else np.zeros(0, dtype=np.int64)
+        present = np.nonzero(counts)[0]
+        return {'degrees': present.tolist(), 'nodes': counts[present].tolist()}
+
+    @cached_property
+    def degree_distributions(self):
+        """Number of nodes with each in-degree (times cited) and out-degree (references)"""
+        return {
+            'in': self._distribution(self.in_degrees),
+            'out': self._distribution(self.out_degrees)
+        }
+
+    @cached_property
+    def pagerank(self):
+        return self.compute_pagerank()
+
+    def compute_pagerank(self, damping=0.85, tolerance=1e-10, max_iterations=100):
+        """PageRank by power iteration; dangling nodes spread their rank uniformly"""
+        n = self.node_count
+        if n == 0:
+            return np.zeros(0)
+        out_degrees = self.out_degrees
+        dangling = out_degrees == 0
+        edge_weight = 1.0 / out_degrees[self.src] if self.edge_count else np.zeros(0)
+        rank = np.full(n, 1.0 / n)
+        for _ in range(max_iterations):
+            spread = np.bincount(self.dst, weights=rank[self.src] * edge_weight, minlength=n)
+            updated = damping * (spread + rank[dangling].sum() / n) + (1.0 - damping) / n
+            converged = np.abs(updated - rank).sum() < tolerance
+            rank = updated
+            if converged:
+                break
+        return rank
+
+    @cached_property
+    def pagerank_ranking(self):
+        """The MAX_RANKED highest-PageRank nodes, best first"""
+        order = np.argsort(-self.pagerank, kind='stable')[:MAX_RANKED]
+        return [self.node(int(i), pagerank=float(self.pagerank[i]), cited_by=int(self.in_degrees[i]))
+                for i in order]
+
+    def top_pagerank(self, limit=20):
+        return self.pagerank_ranking[:limit]
+
+    @cached_property
+    def component_labels(self):
+        """Weakly connected component label (smallest member id) of every node"""
+        labels = np.arange(self.node_count, dtype=np.int64)
+        while True:
+            previous = labels
+            labels = labels.copy()
+            np.minimum.at(labels, self.src, labels[self.dst])
+            np.minimum.at(labels, self.dst, labels[self.src])
+            labels = labels[labels]  # pointer jumping
+            if np.array_equal(labels, previous):
+                return labels
+
+    @cached_property
+    def component_ranking(self):
+        """Component count and the MAX_RANKED largest components by size"""
+        roots, sizes = np.unique(self.component_labels, return_counts=True)
+        order = np.argsort(-sizes, kind='stable')[:MAX_RANKED]
+        return {
+            'count': int(len(roots)),
+            'largest': [
+                {'size': int(sizes[i]), 'example': self.node(int(roots[i]))}
+                for i in order
+            ]
+        }
+
+    def components(self, limit=20):
+        """Component count and the largest components by size"""
+        ranking = self.component_ranking
+        return {'count': ranking['count'], 'largest': ranking['largest'][:limit]}
+
+    def neighborhood(self, key, hops=1, direction='both', limit=500):
+        """Nodes within hops edges of key, as {'nodes': [...], 'total': n}
+
+        direction is 'out' (works it cites), 'in' (works citing it) or 'both'.
+        Raises KeyError for an unknown node.
+        """
+        start = self.ids[key.strip().lower()]
+        adjacency = []
+        if direction in ('out', 'both'):
+            adjacency.append((self.out_indptr, self.out_indices))
+        if direction in ('in', 'both'):
+            adjacency.append((self.in_indptr, self.in_indices))
+
+        distance = np.full(self.node_count, -1, dtype=np.int64)
+        distance[start] = 0
+        frontier = np.array([start], dtype=np.int64)
+        for hop in range(1, hops + 1):
+            reached = np.concatenate([gather_neighbors(ptr, idx, frontier) for ptr, idx in adjacency])
+            reached = np.unique(reached)
+            frontier = reached[distance[reached] < 0]
+            if not len(frontier):
+                break
+            distance[frontier] = hop
+
+        found = np.nonzero(distance > 0)[0]
+        found = found[np.lexsort((found, distance[found]))]
+        return {
+            'node': self.node(start),
+            'total': int(len(found)),
+            'nodes': [self.node(int(i), hops=int(distance[i])) for i in found[:limit]]
+        }
+
+    def summary(self):
+        return {
+            'nodes': self.node_count,
+            'edges': self.edge_count,
+            'seeds': sum(1 for node in self.nodes if node['kind'] == 'seed'),
+            'components': self.component_ranking['count']
+        }
+
+    def __repr__(self):
+        return f"CitationGraph(nodes={self.node_count}, edges={self.edge_count})"
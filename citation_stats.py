@@ -0,0 +1,154 @@
+"""
+Aggregate citation statistics for the research datasets, computed with NumPy
+Statistics are derived once per loaded dataset version and served as a single
+compact document, so pages never reduce over the full paper list themselves.
+"""
+from collections.abc import Mapping
+
+import numpy as np
+
+from paper_index import concept_names
+
+PERCENTILES = (25, 50, 75, 90, 99)
+
+
+def citation_counts(papers):
+    """cited_by_count of every paper as an int64 array (missing counts as 0)"""
+    return np.fromiter(
+        (c if isinstance(c, (int, float)) else 0 for c in (p.get('cited_by_count') for p in papers)),
+        dtype=np.int64, count=len(papers)
+    )
+
+
+def publication_years(papers):
+    """Publication year of every paper as an int64 array (missing years as 0)"""
+    return np.fromiter(
+        (y if isinstance(y, int) else 0 for y in (p.get('year') for p in papers)),
+        dtype=np.int64, count=len(papers)
+    )
+
+
+def citation_distribution(counts):
+    """Total, mean, median, max and percentiles of a citation count array"""
+    if not len(counts):
+        return {'total': 0, 'mean': 0.0, 'median': 0.0, 'max': 0,
+                'percentiles': {f"p{p}": 0.0 for p in PERCENTILES}}
+    percentiles = np.percentile(counts, PERCENTILES)
+    return {
+        'total': int(counts.sum()),
+        'mean': round(float(counts.mean()), 2),
+        'median': float(np.median(counts)),
+        'max': int(counts.max()),
+        'percentiles': {f"p{p}": round(float(v), 2) for p, v in zip(PERCENTILES, percentiles)}
+    }
+
+
+def per_year(years, counts):
+    """Papers, citations and cumulative papers for each publication year (undated papers left out)"""
+    dated = years > 0
+    unique_years, inverse = np.unique(years[dated], return_inverse=True)
+    papers = np.bincount(inverse, minlength=len(unique_years))
+    citations = np.bincount(inverse, weights=counts[dated], minlength=len(unique_years))
+    return {
+        'years': unique_years.tolist(),
+        'papers': papers.tolist(),
+        'citations': citations.astype(np.int64).tolist(),
+        'cumulative_papers': np.cumsum(papers).tolist()
+    }
+
+
+def top_cited(papers, counts, n=10):
+    """The n most cited papers, most cited first"""
+    order = np.argsort(-counts, kind='stable')[:n]
+    return [
+        {
+            'title': papers[i].get('title'),
+            'year': papers[i].get('year'),
+            'doi': papers[i].get('doi'),
+            'cited_by_count': int(counts[i]),
+            'source_dataset': papers[i].get('source_dataset')
+        }
+        for i in order
+    ]
+
+
+def concept_frequencies(papers, n=20):
+    """The n most frequent concepts and how many papers carry each"""
+    names = [concept for paper in papers for concept in set(concept_names(paper))]
+    if not names:
+        return []
+    concepts, frequencies = np.unique(np.array(names, dtype=object), return_counts=True)
+    order = np.argsort(-frequencies, kind='stable')[:n]
+    return [{'concept': concepts[i], 'papers': int(frequencies[i])} for i in order]
+
+
+def dataset_overlaps(datasets):
+    """Number of papers (by DOI, else title) shared by each pair of datasets"""
+    identifiers = {
+        name: {paper.get('doi') or paper.get('title') for paper in papers} - {None, ''}
+        for name, papers in datasets.items()
+    }
+    names = sorted(identifiers)
+    return [
+        {'datasets': [a, b], 'papers': len(identifiers[a] & identifiers[b])}
+        for i, a in enumerate(names) for b in names[i + 1:]
+    ]
+
+
+def h_index(counts):
+    """Largest h such that h papers have at least h citations each"""
+    ranked = np.sort(counts)[::-1]
+    return int(np.count_nonzero(ranked >= np.arange(1, len(ranked) + 1)))
+
+
+def year_histogram(years):
+    """Papers per publication year (undated papers left out)"""
+    unique_years, papers = np.unique(years[years > 0], return_counts=True)
+    return {'years': unique_years.tolist(), 'papers': papers.tolist()}
+
+
+def citation_statistics(papers):
+    """Citation metadata for one dataset: mean, median, percentiles, h/i10-index and year histogram"""
+    papers = [paper for paper in papers if isinstance(paper, Mapping)] if isinstance(papers, list) else []
+    counts = citation_counts(papers)
+    distribution = citation_distribution(counts)
+    return {
+        'total_papers': len(papers),
+        'total_citations': distribution['total'],
+        'average_citations': distribution['mean'],
+        'median_citations': distribution['median'],
+        'max_citations': distribution['max'],
+        'citation_percentiles': distribution['percentiles'],
+        'h_index': h_index(counts),
+        'i10_index': int(np.count_nonzero(counts >= 10)),
+        'year_histogram': year_histogram(publication_years(papers))
+    }
+
+
+def archimedes_stats(papers, datasets, top_n=10, top_concepts=20):
+    """The aggregate statistics document served by /api/archimedes/stats"""
+    counts = citation_counts(papers)
+    years = publication_years(papers)
+    dated = years[years > 0]
+    merged_sources = {}
+    for paper in papers:
+        source = paper.get('source_dataset')
+        merged_sources[source] = merged_sources.get(source, 0) + 1
+    categories = set()
+    for paper in papers:
+        categories.update(paper.get('categories') or [])
+
+    return {
+        'total_papers': len(papers),
+        'year_range': [int(dated.min()), int(dated.max())] if len(dated) else None,
+        'category_count': len(categories),
+        'citations': citation_distribution(counts),
+        'per_year': per_year(years, counts),
+        'top_cited': top_cited(papers, counts, top_n),
+        'datasets': {
+            name: {'papers': len(dataset_papers), 'unique_papers': merged_sources.get(name, 0)}
+            for name, dataset_papers in datasets.items()
+        },
+        'overlaps': dataset_overlaps(datasets),
+        'concepts': concept_frequencies(papers, top_concepts)
+    }
@@ -0,0 +1,49 @@
+"""
+Concept exclusion filter for OpenAlex papers
+All exclusion terms are compiled into a single alternation regex and matched
+once against a paper's joined, lowercased concepts (same semantics as testing
+each term as a substring). Results are memoized per concept list, since
+large OpenAlex pulls repeat the same concept combinations many times.
+"""
+import json
+import os
+import re
+
+
+class ConceptFilter:
+    """Matches concept lists against a configurable set of exclusion terms"""
+    def __init__(self, terms, cache_size=100000):
+        self.terms = frozenset(term.lower() for term in terms if term)
+        alternatives = '|'.join(re.escape(term) for term in sorted(self.terms))
+        self.pattern = re.compile(alternatives) if alternatives else None
+        self.cache_size = cache_size
+        self.cache = {}
+
+    @classmethod
+    def from_file(cls, filepath, **kwargs):
+        """Build a filter from a JSON array of terms"""
+        with open(filepath, 'r') as f:
+            return cls(json.load(f), **kwargs)
+
+    @classmethod
+    def from_env(cls, variable, default_terms, **kwargs):
+        """Build a filter from the JSON terms file named by an environment variable, or the defaults"""
+        filepath = os.getenv(variable)
+        if filepath:
+            return cls.from_file(filepath, **kwargs)
+        return cls(default_terms, **kwargs)
+
+    def excludes(self, concepts):
+        """True if any exclusion term appears in the concepts"""
+        if self.pattern is None or not concepts:
+            return False
+        key = tuple(concepts)
+        excluded = self.cache.get(key)
+        if excluded is None:
+            excluded = self.pattern.search(' '.join(concepts).lower()) is not None
+            if len(self.cache) < self.cache_size:
+                self.cache[key] = excluded
+        return excluded
+
+    def __repr__(self):
+        return f"ConceptFilter(terms={len(self.terms)}, cached={len(self.cache)})"
@@ -21,6 +21,7 @@ class ContactLinkedList:
         self.head = None
         self.tail = None
         self.size = 0
+        self.index = {}
     
     def append(self, service_id, endpoint, data):
         """Add a new contact microservice to the end of the list"""
@@ -33,17 +34,13 @@ class ContactLinkedList:
             self.tail.next = new_node
             self.tail = new_node
         
+        self.index.setdefault(service_id, new_node)
         self.size += 1
         return new_node
     
     def get(self, service_id):
-        """Get a microservice by ID"""
-        current = self.head
-        while current:
-            if current.service_id == service_id:
-                return current
-            current = current.next
-        return None
+        """Get a microservice by ID (O(1) via the id index)"""
+        return self.index.get(service_id)
     
     def traverse(self):
         """Generator to traverse the linked list"""
@@ -0,0 +1,82 @@
+"""
+Set algebra over citation datasets
+Every distinct paper identifier (DOI, else title) across the datasets gets a
+dense integer id and each dataset is stored as a bitset (a Python int), so
+intersections, unions and differences of any datasets are a few big-integer
+operations instead of a pre-built JSON file per combination.
+"""
+import operator
+from collections.abc import Mapping
+from functools import reduce
+
+import numpy as np
+
+OPERATIONS = ('intersection', 'union', 'difference')
+
+
+def paper_identifier(paper):
+    """Identifier used to match a paper across datasets (DOI, else title)"""
+    return paper.get('doi') or paper.get('title')
+
+
+class DatasetSets:
+    """Datasets as bitsets over dense paper ids"""
+    def __init__(self, datasets):
+        self.ids = {}
+        self.records = []
+        members = {}
+        for name, papers in datasets.items():
+            if not isinstance(papers, list):
+                continue
+            positions = []
+            for paper in papers:
+                identifier = paper_identifier(paper) if isinstance(paper, Mapping) else None
+                if not identifier:
+                    continue
+                if identifier not in self.ids:
+                    self.ids[identifier] = len(self.records)
+                    self.records.append(paper)
+                positions.append(self.ids[identifier])
+            members[name] = positions
+
+        self.size = len(self.records)
+        self.bitsets = {name: self._pack(positions) for name, positions in members.items()}
+
+    def _pack(self, positions):
+        flags = np.zeros(self.size, dtype=bool)
+        flags[positions] = True
+        return int.from_bytes(np.packbits(flags, bitorder='little').tobytes(), 'little')
+
+    def positions(self, bitset):
+        """Sorted dense ids of the members of a bitset"""
+        if not bitset:
+            return np.empty(0, dtype=np.int64)
+        raw = np.frombuffer(bitset.to_bytes((self.size + 7) // 8, 'little'), dtype=np.uint8)
+        return np.nonzero(np.unpackbits(raw, bitorder='little')[:self.size])[0]
+
+    def evaluate(self, operation, names):
+        """Bitset of papers in the intersection/union of the datasets, or the first minus the rest
+
+        Raises KeyError for an unknown dataset, ValueError for an unknown operation.
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"op must be one of: {', '.join(OPERATIONS)}")
+        if not names:
+            raise ValueError("at least one dataset is required")
+        bitsets = [self.bitsets[name] for name in names]
+        if operation == 'intersection':
+            return reduce(operator.and_, bitsets)
+        if operation == 'union':
+            return reduce(operator.or_, bitsets)
+        return bitsets[0] & ~reduce(operator.or_, bitsets[1:], 0)
+
+    def papers(self, positions):
+        """Paper records for dense ids"""
+        return [self.records[i] for i in positions]
+
+    def counts(self):
+        """Number of distinct papers in each dataset"""
+        return {name: bitset.bit_count() for name, bitset in self.bitsets.items()}
+
+    def __repr__(self):
+        return f"DatasetSets(datasets={len(self.bitsets)}, papers={self.size})"
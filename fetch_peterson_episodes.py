@@ -14,20 +14,23 @@ Usage:
     python fetch_peterson_episodes.py --channel @JordanBPeterson
 """
 
-import os
 import sys
-import json
 import argparse
 import requests
 import scrapetube
 import time
 from youtube_transcript_api import YouTubeTranscriptApi
 from datetime import datetime
+from rate_limit import (AdaptiveRateController, FAILURE_MESSAGES, PERMANENT_STATUSES, TokenBucket,
+                        classify_fetch_error)
+from transcript_store import TranscriptStore, store_path_for
 
 
 class PetersonPodcastFetcher:
-    def __init__(self, output_file="flask_data/podcasts.json"):
+    def __init__(self, output_file="flask_data/podcasts.json", rate=1.0, max_rate=None, cooldown=60):
         self.output_file = output_file
+        self.store = TranscriptStore(store_path_for(output_file))
+        self.limiter = AdaptiveRateController(TokenBucket(rate), max_rate=max_rate, cooldown=cooldown)
         self.api = YouTubeTranscriptApi()
     
     def fetch_from_youtube_channel(self, channel_id, max_results=None):
@@ -103,6 +106,7 @@ class PetersonPodcastFetcher:
                     print(f"  Waiting {wait_time}s before retry...")
                     time.sleep(wait_time)
                 
+                self.limiter.acquire()
                 transcript = self.api.fetch(youtube_id, languages=['en'])
                 full_text = " ".join([snippet.text for snippet in transcript.snippets])
                 segments = [
@@ -113,9 +117,7 @@ class PetersonPodcastFetcher:
                     }
                     for snippet in transcript.snippets
                 ]
-                
-                # Small delay even on success to avoid rate limiting
-                time.sleep(1)
+                self.limiter.record('success')
                 
                 return {
                     "full_text": full_text,
@@ -124,9 +126,20 @@ class PetersonPodcastFetcher:
                 }
             except Exception as e:
                 error_msg = str(e)
+                failure = classify_fetch_error(e)
+                self.limiter.record(failure)
+                
+                # Disabled / missing captions will not change on retry
+                if failure in PERMANENT_STATUSES:
+                    return {
+                        "full_text": None,
+                        "segments": None,
+                        "status": "error",
+                        "error": FAILURE_MESSAGES[failure]
+                    }
                 
                 # Check if it's an IP block
-                if "Could not retrieve a transcript" in error_msg:
+                if failure in ('ip_blocked', 'failed'):
                     if attempt < retries - 1:
                         print(f"  Rate limited, retry {attempt + 1}/{retries}...")
                         continue
@@ -194,19 +207,21 @@ class PetersonPodcastFetcher:
         
         print(f"\n📋 Found {len(episodes)} episodes to process")
         
-        # Fetch transcripts for each
+        # Seed the store from an existing export so other episodes are kept
+        self.store.seed_from(self.output_file)
+        
+        # Fetch transcripts for each, storing every entry as it completes
         results = []
         for youtube_id, title, guest, date in episodes:
             entry = self.create_episode_entry(youtube_id, title, guest, date)
+            self.store.upsert(entry)
             results.append(entry)
         
-        # Save to JSON
+        # Export the store to JSON
         print(f"\n💾 Saving to {self.output_file}...")
-        os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        saved = self.store.export_json(self.output_file)
         
-        print(f"✓ Saved {len(results)} episodes")
+        print(f"✓ Saved {saved} episodes ({len(results)} fetched this run)")
         
         # Statistics
         success_count = sum(1 for r in results if r.get('transcript_status') == 'success')
@@ -230,10 +245,14 @@ def main():
     parser.add_argument('--limit', type=int, help='Limit number of episodes to fetch')
     parser.add_argument('--output', default='flask_data/podcasts.json', help='Output JSON file')
     parser.add_argument('--channel', default='@JordanBPeterson', help='YouTube channel ID')
+    parser.add_argument('--rate', type=float, default=1.0, help='Starting transcript requests per second')
+    parser.add_argument('--max-rate', type=float, help='Ceiling for the adaptive rate (default: 4x --rate)')
+    parser.add_argument('--cooldown', type=float, default=60, help='Seconds to hold the rate after a block')
     
     args = parser.parse_args()
     
-    fetcher = PetersonPodcastFetcher(output_file=args.output)
+    fetcher = PetersonPodcastFetcher(output_file=args.output, rate=args.rate,
+                                     max_rate=args.max_rate, cooldown=args.cooldown)
     fetcher.fetch_all(limit=args.limit)
 
 
@@ -3,9 +3,9 @@
 Fetch YouTube transcripts for podcast episodes and save to JSON.
 """
 
-import json
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
+from transcript_store import TranscriptStore, store_path_for
 
 # Podcast episodes from resume
 PODCASTS = [
@@ -94,7 +94,9 @@ def fetch_transcript(youtube_id):
 
 def main():
     """Fetch all transcripts and save to JSON."""
-    results = []
+    output_path = "flask_data/podcasts.json"
+    store = TranscriptStore(store_path_for(output_path))
+    store.seed_from(output_path)  # keep episodes other scripts fetched
     
     for podcast in PODCASTS:
         print(f"Fetching transcript for: {podcast['title']} ({podcast['youtube_id']})")
@@ -116,14 +118,13 @@ def main():
             word_count = len(transcript_data["full_text"].split())
             print(f"  ✓ Success: {word_count:,} words")
         
-        results.append(podcast_entry)
+        store.upsert(podcast_entry)
     
     # Save to flask_data/podcasts.json
-    output_path = "flask_data/podcasts.json"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    saved = store.export_json(output_path)
+    store.close()
     
-    print(f"\n✓ Saved {len(results)} podcast entries to {output_path}")
+    print(f"\n✓ Saved {saved} podcast entries to {output_path}")
 
 
 if __name__ == "__main__":
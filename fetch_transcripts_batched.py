@@ -4,16 +4,24 @@ Smart Batch Transcript Fetcher
 
 This script:
 - Reads episode_list.json (all 1070+ episodes)
-- Checks flask_data/podcasts.json for already-fetched transcripts
+- Checks the transcript store (flask_data/podcasts.db, seeded from podcasts.json)
+  for already-fetched transcripts
 - Only fetches missing transcripts (no double calls!)
-- Saves after each successful fetch (resume-friendly)
-- Uses rate limiting to avoid YouTube blocks
+- Skips failed episodes until their retry time: disabled/uncaptioned videos are
+  parked for weeks, transient failures back off exponentially across runs
+- Upserts each fetched episode into a SQLite transcript store (resume-friendly)
+- Exports the store to flask_data/podcasts.json periodically and at the end
+- Fetches with a bounded worker pool, paced by a shared token-bucket rate limiter
+  whose rate adapts (AIMD) to successes and IP blocks
 - Shows progress and ETA
 
 Usage:
     python fetch_transcripts_batched.py
     python fetch_transcripts_batched.py --batch-size 50
     python fetch_transcripts_batched.py --max-episodes 100
+    python fetch_transcripts_batched.py --compact-every 25
+    python fetch_transcripts_batched.py --workers 8 --rate 2 --burst 5
+    python fetch_transcripts_batched.py --ignore-schedule
 """
 
 import os
@@ -21,19 +29,37 @@ import sys
 import json
 import time
 import argparse
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from youtube_transcript_api import YouTubeTranscriptApi
+from rate_limit import (AdaptiveRateController, FAILURE_MESSAGES, PERMANENT_STATUSES, TokenBucket,
+                        classify_fetch_error)
+from retry_schedule import schedule_failure
+from transcript_store import TranscriptStore, store_path_for
 
 
 class BatchTranscriptFetcher:
     def __init__(self, episode_list_file="episode_list.json", 
                  output_file="flask_data/podcasts.json",
-                 batch_size=50, delay=2):
+                 batch_size=50, delay=2, compact_every=100, workers=4, rate=0.5, burst=3,
+                 max_rate=None, cooldown=60, ignore_schedule=False):
         self.episode_list_file = episode_list_file
         self.output_file = output_file
         self.batch_size = batch_size
         self.delay = delay
-        self.api = YouTubeTranscriptApi()
+        self.compact_every = compact_every
+        self.ignore_schedule = ignore_schedule
+        self.workers = max(1, workers)
+        # Every request (including retries) from every worker takes a token;
+        # the rate adapts to how YouTube responds, starting from `rate`
+        self.limiter = AdaptiveRateController(TokenBucket(rate, burst), max_rate=max_rate, cooldown=cooldown)
+        # Fetched episodes are upserted here, then exported to output_file
+        self.store = TranscriptStore(store_path_for(output_file))
+        # One API client per worker thread: each wraps its own requests.Session,
+        # which is not documented as safe to share between threads
+        self.clients = threading.local()
         
         # Ensure output directory exists
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
@@ -52,25 +78,29 @@ class BatchTranscriptFetcher:
         return episodes
     
     def load_existing_transcripts(self):
-        """Load already-fetched transcripts"""
-        if not os.path.exists(self.output_file):
+        """Seed the transcript store from the JSON output the first time"""
+        imported = self.store.seed_from(self.output_file)
+        if imported:
+            print(f"✓ Imported {imported} existing transcripts from {self.output_file}")
+        elif len(self.store):
+            print(f"✓ Found {len(self.store)} episodes in {self.store.path}")
+        else:
             print("📝 No existing transcripts found (starting fresh)")
-            return []
-        
-        with open(self.output_file, 'r') as f:
-            existing = json.load(f)
-        
-        print(f"✓ Found {len(existing)} existing transcripts")
-        return existing
     
-    def get_fetched_ids(self, existing_transcripts):
+    def get_fetched_ids(self):
         """Get set of YouTube IDs that already have transcripts"""
-        fetched = set()
-        for entry in existing_transcripts:
-            # Check if transcript was successfully fetched
-            if entry.get('transcript_status') == 'success' and entry.get('transcript'):
-                fetched.add(entry.get('youtube_id'))
-        return fetched
+        return self.store.ids_with_status('success')
+    
+    def get_deferred_ids(self, now=None):
+        """Map failed YouTube IDs that are not yet due for a retry to their failure class"""
+        return self.store.deferred_ids(now or datetime.now())
+    
+    def api(self):
+        """This thread's YouTubeTranscriptApi client (created on first use)"""
+        client = getattr(self.clients, 'api', None)
+        if client is None:
+            client = self.clients.api = YouTubeTranscriptApi()
+        return client
     
     def fetch_transcript(self, youtube_id, retries=3):
         """Fetch transcript for a single video"""
@@ -80,7 +110,8 @@ class BatchTranscriptFetcher:
                     wait_time = self.delay * (2 ** attempt)
                     time.sleep(wait_time)
                 
-                transcript = self.api.fetch(youtube_id, languages=['en'])
+                self.limiter.acquire()
+                transcript = self.api().fetch(youtube_id, languages=['en'])
                 full_text = " ".join([snippet.text for snippet in transcript.snippets])
                 segments = [
                     {
@@ -90,9 +121,7 @@ class BatchTranscriptFetcher:
                     }
                     for snippet in transcript.snippets
                 ]
-                
-                # Small delay to avoid rate limiting
-                time.sleep(self.delay)
+                self.limiter.record('success')
                 
                 return {
                     "full_text": full_text,
@@ -101,30 +130,48 @@ class BatchTranscriptFetcher:
                     "fetched_at": datetime.now().isoformat()
                 }
             except Exception as e:
-                if "Could not retrieve a transcript" in str(e):
-                    if attempt < retries - 1:
-                        continue
+                failure = classify_fetch_error(e)
+                self.limiter.record(failure)
+                
+                # Disabled / missing captions will not change on retry
+                if failure in PERMANENT_STATUSES or attempt == retries - 1:
                     return {
                         "full_text": None,
                         "segments": None,
                         "status": "error",
-                        "error": "Transcripts disabled or rate limited",
+                        "error": FAILURE_MESSAGES.get(failure, str(e)[:200]),
+                        "failure_class": failure,
                         "fetched_at": datetime.now().isoformat()
                     }
-                
-                if attempt < retries - 1:
-                    continue
-                
-                return {
-                    "full_text": None,
-                    "segments": None,
-                    "status": "error",
-                    "error": str(e)[:200],
-                    "fetched_at": datetime.now().isoformat()
-                }
     
-    def create_episode_entry(self, episode_info, transcript_data):
-        """Create a complete episode entry"""
+    def fetch_in_order(self, episodes):
+        """Yield (episode, transcript_data) in episode order while workers fetch ahead
+
+        At most 2 * workers fetches are queued, so an interrupted run has not
+        spent requests far beyond the last stored episode.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='fetch')
+        episodes = iter(episodes)
+        pending = deque()
+        
+        def submit_next():
+            episode = next(episodes, None)
+            if episode is not None:
+                pending.append((episode, executor.submit(self.fetch_transcript, episode['youtube_id'])))
+        
+        try:
+            for _ in range(self.workers * 2):
+                submit_next()
+            while pending:
+                episode, future = pending.popleft()
+                transcript_data = future.result()
+                submit_next()
+                yield episode, transcript_data
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def create_episode_entry(self, episode_info, transcript_data, previous=None):
+        """Create a complete episode entry (previous: the entry it replaces, for the retry schedule)"""
         # Generate clean ID
         youtube_id = episode_info['youtube_id']
         guest = episode_info.get('guest')
@@ -154,13 +201,13 @@ class BatchTranscriptFetcher:
         
         if "error" in transcript_data:
             entry["transcript_error"] = transcript_data["error"]
+            schedule_failure(entry, transcript_data.get("failure_class", "error"), previous)
         
         return entry
     
-    def save_transcripts(self, transcripts):
-        """Save transcripts to JSON file"""
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            json.dump(transcripts, f, indent=2, ensure_ascii=False)
+    def save_transcripts(self):
+        """Export every episode in the store to the JSON file app.py loads"""
+        self.store.export_json(self.output_file)
     
     def run(self, max_episodes=None):
         """Run the batch fetcher"""
@@ -168,17 +215,22 @@ class BatchTranscriptFetcher:
         print("Smart Batch Transcript Fetcher")
         print("="*80)
         print(f"Batch size: {self.batch_size}")
-        print(f"Delay: {self.delay}s between requests")
+        print(f"Workers: {self.workers} | Rate limit: {self.limiter.rate}/s "
+              f"(adaptive, max {self.limiter.max_rate}/s), burst {self.limiter.bucket.burst}")
+        print(f"Retry backoff: {self.delay}s base")
         print(f"Output: {self.output_file}")
+        print(f"Store: {self.store.path} (exported every {self.compact_every} episodes)")
         print("="*80 + "\n")
         
         # Load data
         all_episodes = self.load_episode_list()
-        existing_transcripts = self.load_existing_transcripts()
-        fetched_ids = self.get_fetched_ids(existing_transcripts)
+        self.load_existing_transcripts()
+        fetched_ids = self.get_fetched_ids()
+        deferred = {} if self.ignore_schedule else self.get_deferred_ids()
         
-        # Find episodes that need transcripts
-        to_fetch = [ep for ep in all_episodes if ep['youtube_id'] not in fetched_ids]
+        # Find episodes that need transcripts (and are due for another attempt)
+        to_fetch = [ep for ep in all_episodes
+                    if ep['youtube_id'] not in fetched_ids and ep['youtube_id'] not in deferred]
         
         if max_episodes:
             to_fetch = to_fetch[:max_episodes]
@@ -186,27 +238,32 @@ class BatchTranscriptFetcher:
         print(f"\n📊 Status:")
         print(f"   Total episodes: {len(all_episodes)}")
         print(f"   Already fetched: {len(fetched_ids)}")
+        if deferred:
+            by_class = Counter(deferred.values())
+            print(f"   Waiting to retry: {len(deferred)} "
+                  f"({', '.join(f'{name}: {count}' for name, count in by_class.most_common())})")
         print(f"   Need to fetch: {len(to_fetch)}")
         
         if not to_fetch:
-            print("\n✓ All episodes already have transcripts!")
+            if deferred:
+                print("\n✓ No episodes are due for a fetch (use --ignore-schedule to retry now)")
+            else:
+                print("\n✓ All episodes already have transcripts!")
+            self.save_transcripts()
             return
         
         # Estimate time
-        estimated_seconds = len(to_fetch) * (self.delay + 2)
+        estimated_seconds = max(0, len(to_fetch) - self.limiter.bucket.burst) / self.limiter.rate
         estimated_minutes = estimated_seconds / 60
         print(f"   Estimated time: ~{estimated_minutes:.1f} minutes")
         print()
         
-        # Create lookup for existing transcripts by youtube_id
-        existing_by_id = {t['youtube_id']: t for t in existing_transcripts if 'youtube_id' in t}
-        
         # Fetch transcripts
         fetched_count = 0
         error_count = 0
         start_time = time.time()
         
-        for i, episode_info in enumerate(to_fetch, 1):
+        for i, (episode_info, transcript_data) in enumerate(self.fetch_in_order(to_fetch), 1):
             youtube_id = episode_info['youtube_id']
             title = episode_info['title']
             
@@ -217,23 +274,14 @@ class BatchTranscriptFetcher:
             eta_seconds = (len(to_fetch) - i) / rate if rate > 0 else 0
             eta_minutes = eta_seconds / 60
             
-            print(f"[{i}/{len(to_fetch)} - {progress:.1f}%] Fetching: {title[:60]}")
+            print(f"[{i}/{len(to_fetch)} - {progress:.1f}%] Fetched: {title[:60]}")
             print(f"   ETA: {eta_minutes:.1f}m | Rate: {rate:.2f} eps/sec | ID: {youtube_id}")
             
-            # Fetch transcript
-            transcript_data = self.fetch_transcript(youtube_id)
-            
             # Create entry
-            episode_entry = self.create_episode_entry(episode_info, transcript_data)
+            episode_entry = self.create_episode_entry(episode_info, transcript_data, self.store.get(youtube_id))
             
-            # Update or add to transcripts
-            if youtube_id in existing_by_id:
-                # Update existing entry
-                idx = existing_transcripts.index(existing_by_id[youtube_id])
-                existing_transcripts[idx] = episode_entry
-            else:
-                # Add new entry
-                existing_transcripts.append(episode_entry)
+            # Upsert into the store right away (resume-friendly!)
+            self.store.upsert(episode_entry)
             
             # Track stats
             if transcript_data["status"] == "success":
@@ -244,17 +292,18 @@ class BatchTranscriptFetcher:
                 print(f"   ❌ Error: {transcript_data.get('error', 'Unknown')}\n")
                 error_count += 1
             
-            # Save after each fetch (resume-friendly!)
-            self.save_transcripts(existing_transcripts)
+            if self.compact_every and i % self.compact_every == 0:
+                self.save_transcripts()
             
-            # Batch pause (every N episodes)
+            # Batch progress report (every N episodes); pacing is left to the rate limiter
             if i % self.batch_size == 0 and i < len(to_fetch):
                 print(f"\n{'='*80}")
                 print(f"Batch checkpoint: {i}/{len(to_fetch)} complete")
                 print(f"Success: {fetched_count} | Errors: {error_count}")
-                print(f"Pausing 10 seconds to avoid rate limiting...")
                 print(f"{'='*80}\n")
-                time.sleep(10)
+        
+        # Export the store to the JSON file app.py loads
+        self.save_transcripts()
         
         # Final summary
         total_time = time.time() - start_time
@@ -266,20 +315,28 @@ class BatchTranscriptFetcher:
         print(f"Errors: {error_count}")
         print(f"Total time: {total_time/60:.1f} minutes")
         print(f"Average: {total_time/len(to_fetch):.1f} seconds per episode")
-        print(f"\nTotal in database: {len(existing_transcripts)} episodes")
-        success_total = sum(1 for t in existing_transcripts if t.get('transcript_status') == 'success')
-        print(f"With transcripts: {success_total}")
+        print(f"\nTotal in database: {len(self.store)} episodes")
+        print(f"With transcripts: {self.store.status_counts().get('success', 0)}")
         print(f"Saved to: {self.output_file}")
         print("="*80)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Smart batch transcript fetcher")
-    parser.add_argument('--batch-size', type=int, default=50, help='Pause after N episodes')
-    parser.add_argument('--delay', type=int, default=2, help='Seconds between requests')
+    parser.add_argument('--batch-size', type=int, default=50, help='Report progress every N episodes')
+    parser.add_argument('--delay', type=int, default=2, help='Base seconds for retry backoff')
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent fetch workers')
+    parser.add_argument('--rate', type=float, default=0.5, help='Starting requests per second across all workers')
+    parser.add_argument('--max-rate', type=float, help='Ceiling for the adaptive rate (default: 4x --rate)')
+    parser.add_argument('--cooldown', type=float, default=60, help='Seconds to hold the rate after a block')
+    parser.add_argument('--burst', type=int, default=3, help='Requests allowed back to back before pacing')
     parser.add_argument('--max-episodes', type=int, help='Max episodes to fetch (for testing)')
     parser.add_argument('--episode-list', default='episode_list.json', help='Input episode list')
     parser.add_argument('--output', default='flask_data/podcasts.json', help='Output file')
+    parser.add_argument('--compact-every', type=int, default=100,
+                        help='Export the store to the output file every N episodes')
+    parser.add_argument('--ignore-schedule', action='store_true',
+                        help='Retry failed episodes now, even if parked or backing off')
     
     args = parser.parse_args()
     
@@ -287,7 +344,14 @@ def main():
         episode_list_file=args.episode_list,
         output_file=args.output,
         batch_size=args.batch_size,
-        delay=args.delay
+        delay=args.delay,
+        compact_every=args.compact_every,
+        workers=args.workers,
+        rate=args.rate,
+        burst=args.burst,
+        max_rate=args.max_rate,
+        cooldown=args.cooldown,
+        ignore_schedule=args.ignore_schedule
     )
     
     fetcher.run(max_episodes=args.max_episodes)
@@ -0,0 +1,69 @@
+"""
+File-backed resource cache
+Keeps the loaded (parsed or serialized) form of a file in memory and reuses it
+until the file's mtime or size changes. Each resource carries an ETag and
+Last-Modified value derived from the file stat so responses can be revalidated.
+"""
+import os
+import threading
+from datetime import datetime, timezone
+
+
+def read_bytes(path):
+    """Default loader: raw file contents"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class FileResource:
+    """Loaded contents of a file plus the stat it was loaded from"""
+    def __init__(self, path, stat, data=None):
+        self.path = path
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+        self.data = data
+        self.etag = f"{self.mtime_ns:x}-{self.size:x}"
+        self.last_modified = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+
+    def matches(self, stat):
+        """True if the file on disk is still the one this resource was loaded from"""
+        return stat.st_mtime_ns == self.mtime_ns and stat.st_size == self.size
+
+    def __repr__(self):
+        return f"FileResource(path='{self.path}', etag='{self.etag}')"
+
+
+class FileCache:
+    """Cache of file resources keyed by path, validated by mtime/size on every access"""
+    def __init__(self):
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def get(self, path, loader=read_bytes):
+        """Get the resource for path, calling loader(path) only if the file changed
+
+        Raises FileNotFoundError if the file does not exist.
+        """
+        stat = os.stat(path)
+        key = (path, loader)
+        resource = self.entries.get(key)
+        if resource is not None and resource.matches(stat):
+            return resource
+
+        resource = FileResource(path, stat, loader(path) if loader else None)
+        with self.lock:
+            self.entries[key] = resource
+        return resource
+
+    def stat(self, path):
+        """Get a resource with validators only (no contents), e.g. for send_file"""
+        return self.get(path, loader=None)
+
+    def invalidate(self, path):
+        """Drop every cached resource for path"""
+        with self.lock:
+            for key in [k for k in self.entries if k[0] == path]:
+                del self.entries[key]
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,91 @@
+"""
+Polling file watcher for hot-reloading datasets
+Each watched group of files has a signature of (mtime_ns, size) per path.
+When a group's signature changes and then stays the same for one more poll
+(so a file still being written is not picked up half-way), its callback runs
+in the watcher thread. A callback that returns False has not handled the
+change yet, so it runs again on the next poll. Polling works on every
+platform and filesystem, including network mounts where inotify events are
+unreliable.
+"""
+import os
+import threading
+
+
+def file_signature(paths):
+    """(path, mtime_ns, size) of each path (None for missing files)"""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((path, None, None))
+    return tuple(signature)
+
+
+class WatchedGroup:
+    """Files whose changes trigger one callback"""
+    def __init__(self, name, get_paths, callback):
+        self.name = name
+        self.get_paths = get_paths
+        self.callback = callback
+        self.signature = file_signature(get_paths())
+        self.pending = None
+
+    def poll(self):
+        """Run the callback if the files changed and have settled; True if it handled the change"""
+        signature = file_signature(self.get_paths())
+        if signature == self.signature:
+            self.pending = None
+            return False
+        if signature != self.pending:
+            self.pending = signature  # changed: wait one more poll for writes to settle
+            return False
+        try:
+            handled = self.callback() is not False
+        except Exception as e:
+            print(f"Error reloading {self.name}: {e}")
+            handled = True  # wait for the next change rather than retrying a broken file
+        if handled:
+            self.signature = signature
+            self.pending = None
+        return handled
+
+
+class FileWatcher:
+    """Polls groups of files in a background thread, once per process"""
+    def __init__(self, interval=5.0):
+        self.interval = interval
+        self.groups = []
+        self.pid = None
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+
+    def watch(self, name, get_paths, callback):
+        """Call callback() when any of get_paths() changes (until it returns something other than False)"""
+        self.groups.append(WatchedGroup(name, get_paths, callback))
+
+    def poll(self):
+        """Check every group once; returns the names of groups that reloaded"""
+        return [group.name for group in self.groups if group.poll()]
+
+    def start(self):
+        """Start polling (no-op if disabled or already started in this process)"""
+        if self.interval <= 0 or self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.pid == os.getpid():
+                return
+            self.pid = os.getpid()
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self._run, name='file-watcher', daemon=True)
+            self.thread.start()
+
+    def _run(self):
+        while not self.stop_event.wait(self.interval):
+            self.poll()
+
+    def stop(self):
+        self.stop_event.set()
@@ -0,0 +1,135 @@
+"""
+Lazily loaded datasets with load state and timings
+A dataset is loaded on first use, or warmed ahead of time in a background
+thread, so worker boot time does not grow with dataset size. A loaded dataset
+can be rebuilt in the background with reload(); the new value is swapped in
+as one (version, value) snapshot, so readers never see a half-updated dataset.
+"""
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+PENDING = 'pending'
+LOADING = 'loading'
+READY = 'ready'
+FAILED = 'failed'
+
+
+class LazyDataset:
+    """A named dataset produced by loader() the first time it is needed"""
+    def __init__(self, name, loader):
+        self.name = name
+        self.loader = loader
+        self.value = None
+        self.state = PENDING
+        self.error = None
+        self.load_seconds = None
+        self.loaded_at = None
+        self.version = 0
+        self.snapshot = (0, None)
+        self.lock = threading.Lock()
+        self.reload_lock = threading.Lock()
+
+    def get(self):
+        """Return the dataset, loading it (once) if needed"""
+        return self.current()[1]
+
+    def current(self):
+        """Return (version, dataset) from the same load, loading it (once) if needed"""
+        if self.state != READY:
+            with self.lock:
+                if self.state != READY:
+                    self._load()
+        return self.snapshot
+
+    def reload(self):
+        """Rebuild the dataset in the calling thread and swap it in
+
+        The previous value keeps being served while the rebuild runs, and is
+        kept if the rebuild fails. Returns True if a new value was swapped in.
+        """
+        with self.reload_lock:
+            start = time.perf_counter()
+            try:
+                value = self.loader()
+            except Exception as e:
+                self.error = str(e)
+                print(f"Error reloading dataset {self.name}: {e}")
+                return False
+            with self.lock:
+                self._set(value, time.perf_counter() - start)
+            return True
+
+    def _load(self):
+        self.state = LOADING
+        start = time.perf_counter()
+        try:
+            value = self.loader()
+        except Exception as e:
+            self.state = FAILED
+            self.error = str(e)
+            self.load_seconds = time.perf_counter() - start
+            raise
+        self._set(value, time.perf_counter() - start)
+
+    def _set(self, value, seconds):
+        self.value = value
+        self.error = None
+        self.load_seconds = seconds
+        self.loaded_at = datetime.now(timezone.utc)
+        self.version += 1
+        self.snapshot = (self.version, value)
+        self.state = READY
+
+    @property
+    def ready(self):
+        return self.state == READY
+
+    @property
+    def loading(self):
+        return self.state == LOADING
+
+    def status(self):
+        """Load state and timing for readiness reporting"""
+        return {
+            'state': self.state,
+            'version': self.version,
+            'load_seconds': round(self.load_seconds, 4) if self.load_seconds is not None else None,
+            'loaded_at': self.loaded_at.isoformat() if self.loaded_at else None,
+            'error': self.error
+        }
+
+    def __repr__(self):
+        return f"LazyDataset(name='{self.name}', state='{self.state}')"
+
+
+class BackgroundWarmer:
+    """Loads a set of lazy datasets in a background thread, once per process"""
+    def __init__(self, datasets):
+        self.datasets = list(datasets)
+        self.pid = None
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def start(self):
+        """Start warming (no-op if already started in this process, e.g. after a fork)"""
+        if self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.pid == os.getpid():
+                return
+            self.pid = os.getpid()
+            self.thread = threading.Thread(target=self._run, name='dataset-warmup', daemon=True)
+            self.thread.start()
+
+    def _run(self):
+        for dataset in self.datasets:
+            try:
+                dataset.get()
+            except Exception as e:
+                print(f"Error warming dataset {dataset.name}: {e}")
+
+    def join(self, timeout=None):
+        if self.thread:
+            self.thread.join(timeout)
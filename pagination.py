@@ -0,0 +1,66 @@
+"""
+Field projection and cursor pagination helpers for list API endpoints
+Cursors are opaque to clients: a URL-safe base64 encoding of the next offset
+"""
+import base64
+import json
+
+
+def parse_field_list(value):
+    """Parse a comma-separated query parameter into a tuple of field names"""
+    if not value:
+        return ()
+    return tuple(field.strip() for field in value.split(',') if field.strip())
+
+
+def normalize_field_list(fields, known):
+    """Sorted, de-duplicated field names, dropping any not in known"""
+    return tuple(sorted(set(fields) & set(known)))
+
+
+def project_record(record, fields=(), exclude=()):
+    """Return a copy of record restricted to fields and without excluded keys"""
+    if fields:
+        return {key: record[key] for key in fields if key in record and key not in exclude}
+    if exclude:
+        return {key: value for key, value in record.items() if key not in exclude}
+    return record
+
+
+def encode_cursor(offset):
+    """Encode an offset as an opaque cursor string"""
+    raw = json.dumps({'o': offset}, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Decode a cursor string back into an offset (raises ValueError if malformed)"""
+    if not cursor:
+        return 0
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        offset = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))['o']
+    except (ValueError, KeyError, TypeError, UnicodeEncodeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError("Invalid cursor")
+    return offset
+
+
+def parse_limit(value, maximum=1000):
+    """Parse a ?limit= value (raises ValueError if not a positive integer)"""
+    if value is None or value == '':
+        return None
+    limit = int(value)
+    if limit < 1:
+        raise ValueError("limit must be a positive integer")
+    return min(limit, maximum)
+
+
+def paginate(records, offset=0, limit=None):
+    """Slice records from offset, returning (page, next_cursor or None)"""
+    if limit is None:
+        return records[offset:], None
+    end = offset + limit
+    next_cursor = encode_cursor(end) if end < len(records) else None
+    return records[offset:end], next_cursor
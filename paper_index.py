@@ -0,0 +1,141 @@
+"""
+Search index over the merged Archimedes papers
+Built once when the corpus loads: an inverted index over title, abstract,
+concepts, authors and journal, exact-match concept and dataset indexes, a
+sorted year column for range queries, and a precomputed rank per sort key,
+so a search is set intersections plus one sort of the matches.
+"""
+import re
+from bisect import bisect_left, bisect_right
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+SORT_KEYS = ('cited_by_count', 'year', 'title')
+
+
+def tokenize(text):
+    """Lowercase alphanumeric tokens of a string"""
+    if not isinstance(text, str):
+        return []
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def concept_names(paper):
+    """Concept names of a paper (plain strings or OpenAlex concept objects)"""
+    names = []
+    for concept in paper.get('concepts') or []:
+        if isinstance(concept, dict):
+            concept = concept.get('display_name')
+        if isinstance(concept, str) and concept:
+            names.append(concept)
+    return names
+
+
+def sort_value(paper, key):
+    if key == 'title':
+        return (paper.get('title') or '').lower()
+    value = paper.get(key)
+    return value if isinstance(value, (int, float)) else 0
+
+
+class PaperIndex:
+    """Positional indexes over a fixed list of papers"""
+    def __init__(self, papers):
+        self.papers = papers
+        self.terms = {}
+        self.concepts = {}
+        self.datasets = {}
+        for position, paper in enumerate(papers):
+            for token in self._paper_tokens(paper):
+                self.terms.setdefault(token, set()).add(position)
+            for concept in concept_names(paper):
+                self.concepts.setdefault(concept.lower(), set()).add(position)
+            dataset = paper.get('source_dataset')
+            if dataset:
+                self.datasets.setdefault(dataset, set()).add(position)
+        # Sorted vocabulary for prefix matching of query terms
+        self.vocabulary = sorted(self.terms)
+
+        # Sorted year column (papers without a year never match a year range)
+        dated = sorted(
+            (paper['year'], position) for position, paper in enumerate(papers)
+            if isinstance(paper.get('year'), int)
+        )
+        self.years = [year for year, _ in dated]
+        self.year_positions = [position for _, position in dated]
+
+        # Ascending order and rank of every paper under each sort key
+        self.orders = {}
+        self.ranks = {}
+        for key in SORT_KEYS:
+            order = sorted(range(len(papers)), key=lambda i, k=key: sort_value(papers[i], k))
+            rank = [0] * len(papers)
+            for r, position in enumerate(order):
+                rank[position] = r
+            self.orders[key] = order
+            self.ranks[key] = rank
+
+    @staticmethod
+    def _paper_tokens(paper):
+        tokens = set(tokenize(paper.get('title')))
+        tokens.update(tokenize(paper.get('abstract')))
+        tokens.update(tokenize(paper.get('journal')))
+        for concept in concept_names(paper):
+            tokens.update(tokenize(concept))
+        for author in paper.get('authors') or []:
+            tokens.update(tokenize(author))
+        return tokens
+
+    def term_matches(self, token):
+        """Positions of papers with an indexed token starting with token"""
+        matches = set()
+        start = bisect_left(self.vocabulary, token)
+        for term in self.vocabulary[start:]:
+            if not term.startswith(token):
+                break
+            matches |= self.terms[term]
+        return matches
+
+    def year_matches(self, year_from=None, year_to=None):
+        """Positions of papers published within [year_from, year_to]"""
+        start = bisect_left(self.years, year_from) if year_from is not None else 0
+        end = bisect_right(self.years, year_to) if year_to is not None else len(self.years)
+        return set(self.year_positions[start:end])
+
+    def search(self, q=None, year_from=None, year_to=None, dataset=None, concept=None,
+               sort=None, descending=True):
+        """Papers matching every given filter, in sort order (index order if no sort)
+
+        Every query term must match (as a word prefix) somewhere in the paper.
+        """
+        if sort is not None and sort not in SORT_KEYS:
+            raise ValueError(f"sort must be one of: {', '.join(SORT_KEYS)}")
+
+        filters = [self.term_matches(token) for token in tokenize(q)]
+        if year_from is not None or year_to is not None:
+            filters.append(self.year_matches(year_from, year_to))
+        if dataset:
+            filters.append(self.datasets.get(dataset, set()))
+        if concept:
+            filters.append(self.concepts.get(concept.lower(), set()))
+
+        if not filters:
+            if sort is None:
+                return list(self.papers)
+            order = self.orders[sort]
+            return [self.papers[i] for i in (reversed(order) if descending else order)]
+
+        filters.sort(key=len)
+        positions = set(filters[0])
+        for matches in filters[1:]:
+            positions &= matches
+            if not positions:
+                return []
+
+        rank = self.ranks[sort].__getitem__ if sort else None
+        return [self.papers[i] for i in sorted(positions, key=rank, reverse=bool(sort) and descending)]
+
+    def __len__(self):
+        return len(self.papers)
+
+    def __repr__(self):
+        return f"PaperIndex(papers={len(self.papers)}, terms={len(self.terms)})"
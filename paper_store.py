@@ -0,0 +1,141 @@
+"""
+Compact in-memory representation of OpenAlex papers
+A parsed paper is a dict with its own hash table and mutable lists; large
+OpenAlex pulls hold tens of thousands of them per worker. Paper keeps the
+common fields in __slots__ (uncommon keys go to a small overflow dict),
+turns list fields into tuples and interns the highly repetitive strings
+(authors, concepts, categories, journals, dataset names). The merge step tags
+papers with a two-slot SourcedPaper view instead of copying each dict.
+
+Both classes are read-only Mappings, so they work anywhere a paper dict was
+read (get, [], in, items) and serialize as plain JSON objects via dict(paper).
+"""
+import sys
+from collections.abc import Mapping
+
+PAPER_FIELDS = ('id', 'doi', 'title', 'year', 'cited_by_count', 'publication_date', 'type',
+                'journal', 'authors', 'concepts', 'categories', 'abstract')
+INTERNED_FIELDS = frozenset({'journal', 'type', 'authors', 'concepts', 'categories'})
+FIELD_SET = frozenset(PAPER_FIELDS)
+
+
+def intern_value(value):
+    """Intern strings (recursively through lists, returned as tuples)"""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return tuple(intern_value(item) for item in value)
+    return value
+
+
+def compact_value(key, value):
+    if key in INTERNED_FIELDS:
+        return intern_value(value)
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def restore_paper(present, values, extra):
+    """Rebuild a pickled Paper (present is a bitmask over PAPER_FIELDS)"""
+    paper = Paper.__new__(Paper)
+    values = iter(values)
+    for bit, field in enumerate(PAPER_FIELDS):
+        if present & (1 << bit):
+            setattr(paper, field, next(values))
+    paper._extra = extra
+    return paper
+
+
+class Paper(Mapping):
+    """Read-only, slotted paper record (unset slots are keys the paper does not have)"""
+    __slots__ = PAPER_FIELDS + ('_extra',)
+
+    def __init__(self, data):
+        extra = {}
+        for key, value in data.items():
+            if key in FIELD_SET:
+                setattr(self, key, compact_value(key, value))
+            else:
+                extra[key] = value
+        self._extra = extra or None
+
+    def __getitem__(self, key):
+        if key in FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in FIELD_SET:
+            return getattr(self, key, default)
+        return self._extra.get(key, default) if self._extra else default
+
+    def __contains__(self, key):
+        if key in FIELD_SET:
+            return hasattr(self, key)
+        return bool(self._extra) and key in self._extra
+
+    def __iter__(self):
+        for field in PAPER_FIELDS:
+            if hasattr(self, field):
+                yield field
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __reduce__(self):
+        present, values = 0, []
+        for bit, field in enumerate(PAPER_FIELDS):
+            if hasattr(self, field):
+                present |= 1 << bit
+                values.append(getattr(self, field))
+        return restore_paper, (present, tuple(values), self._extra)
+
+    def __repr__(self):
+        return f"Paper({self.get('title')!r})"
+
+
+class SourcedPaper(Mapping):
+    """A paper plus the dataset it was merged from, without copying the paper"""
+    __slots__ = ('paper', 'source_dataset')
+
+    def __init__(self, paper, source_dataset):
+        self.paper = paper
+        self.source_dataset = sys.intern(source_dataset)
+
+    def __getitem__(self, key):
+        if key == 'source_dataset':
+            return self.source_dataset
+        return self.paper[key]
+
+    def get(self, key, default=None):
+        if key == 'source_dataset':
+            return self.source_dataset
+        return self.paper.get(key, default)
+
+    def __contains__(self, key):
+        return key == 'source_dataset' or key in self.paper
+
+    def __iter__(self):
+        for key in self.paper:
+            if key != 'source_dataset':
+                yield key
+        yield 'source_dataset'
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"SourcedPaper({self.paper.get('title')!r}, {self.source_dataset!r})"
+
+
+def compact_papers(papers):
+    """Paper records for a parsed list of paper dicts (non-dict entries are kept as-is)"""
+    return [Paper(paper) if isinstance(paper, dict) else paper for paper in papers]
@@ -0,0 +1,127 @@
+"""
+Write-behind persistence for flask_data JSON files
+Mutating endpoints schedule a file to be saved and return immediately.
+A background thread coalesces repeated saves of the same file and writes
+compact JSON atomically (temp file + fsync + rename), so a crash mid-write
+never leaves a truncated file behind.
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+
+
+def encode_json(data):
+    """Compact JSON encoding used for flask_data files"""
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+
+def atomic_write_text(filepath, text):
+    """Write text to filepath atomically (temp file + fsync + rename)"""
+    directory = os.path.dirname(filepath) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(filepath)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    # Make the rename itself durable
+    if hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def atomic_write_json(filepath, data):
+    """Write data as compact JSON to filepath atomically"""
+    atomic_write_text(filepath, encode_json(data))
+
+
+class WriteBehindWriter:
+    """Background writer that coalesces saves of the same file"""
+    def __init__(self, directory, delay=0.05):
+        self.directory = directory
+        self.delay = delay
+        self.pending = {}
+        self.in_flight = 0
+        self.listeners = []
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def schedule(self, filename, get_data):
+        """Queue filename to be saved; get_data() is called at write time for the latest state"""
+        with self.condition:
+            self.pending[filename] = get_data
+            # Start lazily so each forked worker gets its own thread
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+                self.thread.start()
+            self.condition.notify_all()
+
+    def add_listener(self, callback):
+        """Call callback(filename) after each file is durably written"""
+        self.listeners.append(callback)
+
+    def flush(self, timeout=None):
+        """Durability barrier: block until every scheduled save is on disk
+
+        Returns False if the timeout expired first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.condition:
+            while self.pending or self.in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.condition.wait(remaining)
+        return True
+
+    def write(self, filename, data):
+        """Write a file synchronously (atomic) and notify listeners"""
+        self._write_text(filename, encode_json(data))
+
+    def _write_text(self, filename, text):
+        atomic_write_text(os.path.join(self.directory, filename), text)
+        for callback in self.listeners:
+            callback(filename)
+
+    def _encode(self, get_data, attempts=3):
+        """Encode live data that request threads may still be mutating"""
+        for attempt in range(attempts):
+            try:
+                return encode_json(get_data())
+            except RuntimeError:
+                if attempt == attempts - 1:
+                    raise
+                time.sleep(self.delay)
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+            # Let rapid successive mutations collapse into one write
+            time.sleep(self.delay)
+            with self.condition:
+                batch = self.pending
+                self.pending = {}
+                self.in_flight += len(batch)
+
+            for filename, get_data in batch.items():
+                try:
+                    self._write_text(filename, self._encode(get_data))
+                except Exception as e:
+                    print(f"Error saving {filename}: {e}")
+                finally:
+                    with self.condition:
+                        self.in_flight -= 1
+                        self.condition.notify_all()
@@ -85,9 +85,15 @@ class PetersonAnalyzer:
         """Load podcast data from Flask API"""
         print(f"📡 Fetching podcasts from {self.flask_url}")
         try:
-            response = requests.get(f"{self.flask_url}/api/podcasts", headers=self.headers)
+            # Stream one episode per line (NDJSON) instead of one large JSON body
+            response = requests.get(
+                f"{self.flask_url}/api/podcasts",
+                params={'exclude': 'transcript_segments', 'stream': '1'},
+                headers=self.headers,
+                stream=True
+            )
             response.raise_for_status()
-            self.podcasts = response.json()
+            self.podcasts = [json.loads(line) for line in response.iter_lines() if line]
             print(f"✓ Loaded {len(self.podcasts)} podcasts")
             return True
         except Exception as e:
@@ -42,7 +42,11 @@ class PodcastAIAgent:
     def load_podcasts(self):
         """Load all podcast data from Flask API"""
         try:
-            response = requests.get(f"{self.flask_url}/api/podcasts", headers=self.headers)
+            response = requests.get(
+                f"{self.flask_url}/api/podcasts",
+                params={'exclude': 'transcript_segments'},
+                headers=self.headers
+            )
             response.raise_for_status()
             self.podcasts = response.json()
             print(f"✓ Loaded {len(self.podcasts)} podcasts")
@@ -59,7 +59,7 @@ class PodcastSubagent:
     
     def list_podcasts(self):
         """List all available podcasts"""
-        podcasts = self._request('/api/podcasts')
+        podcasts = self._request('/api/podcasts?exclude=transcript_segments')
         
         print(f"\n📻 Available Podcasts ({len(podcasts)} total)\n")
         print("=" * 80)
@@ -111,7 +111,7 @@ class PodcastSubagent:
     
     def search_transcripts(self, keyword):
         """Search for keyword across all podcast transcripts"""
-        podcasts = self._request('/api/podcasts')
+        podcasts = self._request('/api/podcasts?exclude=transcript_segments')
         
         results = []
         for podcast in podcasts:
@@ -0,0 +1,149 @@
+"""
+Request rate limiting for the transcript fetch scripts
+A token bucket shared by every fetch worker: up to `burst` requests can go
+out back to back, after which requests are paced at `rate` per second. An
+AIMD controller tunes that rate from the classified outcome of each fetch.
+"""
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiter"""
+    def __init__(self, rate, burst=1, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Block until a request may be sent; returns the seconds spent waiting"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+            waited += wait
+
+    def set_rate(self, rate):
+        """Change the refill rate (tokens already earned are kept)"""
+        with self.lock:
+            self._refill()
+            self.rate = rate
+
+    def __repr__(self):
+        return f"TokenBucket(rate={self.rate}/s, burst={self.burst})"
+
+
+# Failure categories (as reported by check_rate_limit.py)
+BLOCK_STATUSES = frozenset({'ip_blocked'})
+PERMANENT_STATUSES = frozenset({'disabled', 'not_found'})
+BLOCK_ERROR_NAMES = frozenset({'IpBlocked', 'RequestBlocked', 'TooManyRequests'})
+FAILURE_MESSAGES = {
+    'disabled': "Transcripts are disabled for this video",
+    'not_found': "No transcript found (no captions available)",
+    'ip_blocked': "IP blocked by YouTube",
+    'failed': "Transcripts disabled or rate limited",
+}
+
+
+def classify_fetch_error(error):
+    """Status for a failed transcript fetch: disabled, not_found, ip_blocked, failed or error
+
+    Matches on the exception class name so callers (and tests) do not need
+    youtube_transcript_api's private error module.
+    """
+    name = type(error).__name__
+    if name == 'TranscriptsDisabled':
+        return 'disabled'
+    if name == 'NoTranscriptFound':
+        return 'not_found'
+    message = str(error)
+    if name in BLOCK_ERROR_NAMES or "blocking requests from your IP" in message:
+        return 'ip_blocked'
+    if "Could not retrieve a transcript" in message:
+        return 'failed'
+    return 'error'
+
+
+class AdaptiveRateController:
+    """AIMD control of a TokenBucket's rate from fetch outcomes
+
+    Each success (and each permanent "no transcript" answer, which still means
+    the server is serving us) adds `increase` requests/second up to max_rate.
+    A block signal multiplies the rate by `decrease` (down to min_rate) and
+    starts a cool-down window during which the rate is not raised again and
+    further block signals do not cut it again, since requests already in flight
+    when the block began would otherwise compound the cut. Other failures leave
+    the rate alone.
+    """
+    def __init__(self, bucket, min_rate=0.05, max_rate=None, increase=0.02, decrease=0.5,
+                 cooldown=60.0, clock=time.monotonic, log=print):
+        self.bucket = bucket
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else bucket.rate * 4
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.clock = clock
+        self.log = log
+        self.cooldown_until = None
+        self.logged_rate = bucket.rate
+        self.lock = threading.Lock()
+
+    @property
+    def rate(self):
+        return self.bucket.rate
+
+    def acquire(self):
+        """Wait for the bucket (see TokenBucket.acquire)"""
+        return self.bucket.acquire()
+
+    def in_cooldown(self):
+        return self.cooldown_until is not None and self.clock() < self.cooldown_until
+
+    def record(self, status):
+        """Adjust the rate for one fetch outcome; returns the (possibly new) rate"""
+        with self.lock:
+            rate = self.bucket.rate
+            if status in BLOCK_STATUSES:
+                if self.in_cooldown():
+                    return rate
+                new_rate = max(self.min_rate, rate * self.decrease)
+                self.cooldown_until = self.clock() + self.cooldown
+                self._set_rate(rate, new_rate, f"{status}, cooling down {self.cooldown:.0f}s")
+            elif status == 'success' or status in PERMANENT_STATUSES:
+                if self.in_cooldown() or rate >= self.max_rate:
+                    return rate
+                if self.cooldown_until is not None:
+                    self.cooldown_until = None
+                    self.log(f"[rate] cool-down over, ramping up from {rate:.3f}/s")
+                new_rate = min(self.max_rate, rate + self.increase)
+                # Increases are small and frequent: only log every ~10% of growth
+                if new_rate >= self.logged_rate * 1.1 or new_rate == self.max_rate:
+                    self._set_rate(self.logged_rate, new_rate, "ramping up")
+                else:
+                    self.bucket.set_rate(new_rate)
+            return self.bucket.rate
+
+    def _set_rate(self, old_rate, rate, reason):
+        self.bucket.set_rate(rate)
+        self.logged_rate = rate
+        self.log(f"[rate] {old_rate:.3f}/s -> {rate:.3f}/s ({reason})")
+
+    def __repr__(self):
+        return f"AdaptiveRateController(rate={self.rate:.3f}/s, range={self.min_rate}-{self.max_rate}/s)"
@@ -0,0 +1,75 @@
+"""
+Id-indexed record collections for the Flask data layer
+Each registry keeps the ordered record list (used for JSON output and templates)
+next to an id -> record dict so detail lookups are O(1)
+"""
+
+
+class RecordRegistry:
+    """Ordered list of records with a hash index on a key field"""
+    def __init__(self, records=None, key='id'):
+        self.key = key
+        self.records = []
+        self.index = {}
+        self.field_names = set()
+        self.replace(records or [])
+
+    def _index_record(self, record):
+        """Add a record to the index (first record with a given id wins, like a linear scan)"""
+        if isinstance(record, dict):
+            self.field_names.update(record)
+            if self.key in record:
+                self.index.setdefault(record[self.key], record)
+
+    def replace(self, records):
+        """Replace all records in place and rebuild the index"""
+        self.records[:] = records
+        self.index = {}
+        self.field_names = set()
+        for record in self.records:
+            self._index_record(record)
+
+    def append(self, record):
+        """Add a record to the end of the collection"""
+        self.records.append(record)
+        self._index_record(record)
+        return record
+
+    def remove(self, record_id):
+        """Remove every record with the given id, returning the first one removed"""
+        record = self.index.pop(record_id, None)
+        if record is None:
+            return None
+        self.records[:] = [r for r in self.records if r.get(self.key) != record_id]
+        return record
+
+    def get(self, record_id, default=None):
+        """Get a record by id"""
+        return self.index.get(record_id, default)
+
+    def fields(self):
+        """Every key used by any record (may still include keys of removed records)"""
+        return self.field_names
+
+    def ids(self):
+        """Return a view of all indexed ids"""
+        return self.index.keys()
+
+    def to_list(self):
+        """Return the underlying record list for JSON serialization"""
+        return self.records
+
+    def __contains__(self, record_id):
+        return record_id in self.index
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, position):
+        return self.records[position]
+
+    def __repr__(self):
+        return f"RecordRegistry(key='{self.key}', records={len(self.records)})"
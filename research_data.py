@@ -0,0 +1,208 @@
+"""
+Research citation datasets served by the Archimedes endpoints
+- Archimedes: OpenAlex citation networks of foundational mental rotation papers
+- Peterson: Jordan B. Peterson citation network datasets
+"""
+import os
+
+from citation_stats import citation_statistics
+from concept_filter import ConceptFilter
+from paper_index import PaperIndex
+from paper_store import SourcedPaper, compact_papers
+from snapshot_cache import SnapshotCache
+from startup import StartupProfile, load_parallel, read_json
+
+# Load Archimedes mental rotation research data from mental-rotation-research repository
+# Try mental-rotation-research repo first, fallback to Archimedes directory
+MENTAL_ROTATION_REPO = os.path.join(os.path.expanduser('~'), 'mental-rotation-research')
+ARCHIMEDES_OPENALEX_DIR = os.path.join(MENTAL_ROTATION_REPO, 'data', 'archimedes_openalex')
+ARCHIMEDES_FALLBACK_DIR = os.path.join(os.path.expanduser('~'), 'Archimedes')
+
+# Define datasets to load
+# These are citation networks from foundational mental rotation papers
+ARCHIMEDES_FILES = {
+    'overlap_citations': 'overlap_citations_clean.json',  # Papers citing BOTH Shepard & Metzler (1971) AND Vandenberg & Kuse (1978)
+    'shepard_metzler_citations': 'shepard_metzler_1971_citations_clean.json',  # Papers citing Shepard & Metzler (1971)
+    'vandenberg_kuse_citations': 'vandenberg_kuse_1978_citations_clean.json',  # Papers citing Vandenberg & Kuse (1978)
+}
+
+# Seed works cited by every paper in each dataset (citation graph roots)
+ARCHIMEDES_SEEDS = {
+    'overlap_citations': ['Shepard & Metzler (1971)', 'Vandenberg & Kuse (1978)'],
+    'shepard_metzler_citations': ['Shepard & Metzler (1971)'],
+    'vandenberg_kuse_citations': ['Vandenberg & Kuse (1978)'],
+}
+
+# Medical concepts to exclude
+MEDICAL_EXCLUDE_CONCEPTS = {
+    'medicine', 'radiology', 'surgery', 'pulmonary', 'clinical', 'medical',
+    'patient', 'disease', 'therapy', 'diagnosis', 'pathology', 'anatomy',
+    'computed tomography', 'ct scan', 'mri', 'imaging', 'radiography',
+    'lung', 'heart', 'vascular', 'organ', 'tissue', 'cancer', 'tumor'
+}
+
+# Override with a JSON array of terms: ARCHIMEDES_EXCLUDE_CONCEPTS_FILE=/path/to/terms.json
+ARCHIMEDES_CONCEPT_FILTER = ConceptFilter.from_env('ARCHIMEDES_EXCLUDE_CONCEPTS_FILE', MEDICAL_EXCLUDE_CONCEPTS)
+
+# Merged corpus snapshots, rebuilt whenever a source file's contents change
+ARCHIMEDES_SNAPSHOTS = SnapshotCache(
+    os.getenv('ARCHIMEDES_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache'))
+)
+
+# Load Peterson citation network data
+PETERSON_CITATIONS_DIR = os.path.join(os.path.expanduser('~'), 'Archimedes', 'peterson_citations')
+
+PETERSON_FILES = {
+    'peterson_network': 'jordan_peterson_network_cleaned.json',
+    'peterson_papers': 'jordan_peterson_papers_cleaned.json',
+    'maps_of_meaning': 'maps_of_meaning_citations_openalex.json',
+    'maps_of_meaning_curated': 'maps_of_meaning_citations.json'
+}
+
+# Seed works cited by the Peterson citation datasets (peterson_papers are his own papers, not citers)
+PETERSON_SEEDS = {
+    'peterson_network': ['Jordan B. Peterson'],
+    'maps_of_meaning': ['Maps of Meaning (1999)'],
+    'maps_of_meaning_curated': ['Maps of Meaning (1999)'],
+}
+
+
+def archimedes_source_path(filename):
+    """Path of an Archimedes dataset file (mental-rotation-research first, Archimedes fallback)"""
+    filepath = os.path.join(ARCHIMEDES_OPENALEX_DIR, filename)
+    if not os.path.exists(filepath):
+        filepath = os.path.join(ARCHIMEDES_FALLBACK_DIR, filename)
+    return filepath
+
+
+def archimedes_source_paths():
+    """Paths of every Archimedes dataset file"""
+    return [archimedes_source_path(filename) for filename in ARCHIMEDES_FILES.values()]
+
+
+def peterson_source_paths():
+    """Paths of every Peterson dataset file"""
+    return [os.path.join(PETERSON_CITATIONS_DIR, filename) for filename in PETERSON_FILES.values()]
+
+
+def load_archimedes_file(dataset_name, filename, profile):
+    """Load one Archimedes dataset file (a missing file loads as an empty list)"""
+    try:
+        with profile.phase('parse', filename):
+            papers = compact_papers(read_json(archimedes_source_path(filename)))
+        print(f"Loaded {len(papers)} papers from {dataset_name}")
+        return papers
+    except FileNotFoundError:
+        print(f"Warning: {filename} not found in mental-rotation-research or Archimedes directory")
+        return []
+
+
+def load_archimedes_datasets(profile=None):
+    """Load every Archimedes dataset file concurrently"""
+    profile = profile or StartupProfile()
+    return load_parallel({
+        dataset_name: (lambda n=dataset_name, f=filename: load_archimedes_file(n, f, profile))
+        for dataset_name, filename in ARCHIMEDES_FILES.items()
+    })
+
+
+def merge_archimedes_papers(datasets, profile=None, concept_filter=None):
+    """Create combined dataset (removing duplicates by DOI/title)
+
+    Filter to only papers published after 1971 (papers that could cite Shepard & Metzler 1971)
+    Exclude medical/clinical papers (pulmonary, radiology, etc.)
+    """
+    profile = profile or StartupProfile()
+    concept_filter = concept_filter or ARCHIMEDES_CONCEPT_FILTER
+
+    with profile.phase('filter', 'archimedes'):
+        candidates = []
+        for dataset_name, papers in datasets.items():
+            for paper in papers:
+                # Filter: only papers from 1972 onwards
+                paper_year = paper.get('year')
+                if paper_year and paper_year < 1972:
+                    continue
+
+                # Filter: exclude medical/clinical papers
+                if concept_filter.excludes(paper.get('concepts', [])):
+                    continue
+
+                candidates.append((dataset_name, paper))
+
+    with profile.phase('dedup', 'archimedes'):
+        all_papers = []
+        seen_identifiers = set()
+        for dataset_name, paper in candidates:
+            # Use DOI as primary identifier, fall back to title
+            identifier = paper.get('doi') or paper.get('title')
+            if identifier and identifier not in seen_identifiers:
+                seen_identifiers.add(identifier)
+                # Add dataset source tag (a view, the paper itself is not copied)
+                all_papers.append(SourcedPaper(paper, dataset_name))
+
+    print(f"Total unique papers across all datasets (1972+): {len(all_papers)}")
+    return all_papers
+
+
+def build_archimedes_corpus(profile=None):
+    """Load the Archimedes datasets and the merged, deduplicated paper list"""
+    datasets = load_archimedes_datasets(profile)
+    return {
+        'datasets': datasets,
+        'papers': merge_archimedes_papers(datasets, profile)
+    }
+
+
+def load_archimedes_corpus(profile=None):
+    """Load the Archimedes corpus from its binary snapshot (rebuilt if any source changed) and index it"""
+    corpus = ARCHIMEDES_SNAPSHOTS.get_or_build(
+        'archimedes_corpus',
+        archimedes_source_paths(),
+        lambda: build_archimedes_corpus(profile),
+        settings=(sorted(ARCHIMEDES_FILES.items()), sorted(ARCHIMEDES_CONCEPT_FILTER.terms)),
+        profile=profile
+    )
+    # The search index is rebuilt from the snapshot rather than pickled with it
+    with (profile or StartupProfile()).phase('index', 'archimedes'):
+        corpus['index'] = PaperIndex(corpus['papers'])
+    print(f"Archimedes corpus ready: {len(corpus['papers'])} unique papers")
+    return corpus
+
+
+def load_peterson_file(dataset_name, filename, profile):
+    """Load one Peterson citation dataset (missing or broken files load as empty lists)"""
+    try:
+        filepath = os.path.join(PETERSON_CITATIONS_DIR, filename)
+        with profile.phase('parse', filename):
+            data = read_json(filepath)
+        # Handle both metadata+papers structure and simple papers structure
+        if isinstance(data, dict) and 'papers' in data:
+            data = data['papers']
+        papers_count = len(data) if isinstance(data, list) else 0
+        print(f"Loaded {papers_count} papers from {dataset_name}")
+        return data
+    except FileNotFoundError:
+        print(f"Warning: {filename} not found in {PETERSON_CITATIONS_DIR}")
+        return []
+    except Exception as e:
+        print(f"Error loading {filename}: {e}")
+        return []
+
+
+def load_peterson_datasets(profile=None):
+    """Load every Peterson citation dataset concurrently"""
+    profile = profile or StartupProfile()
+    return load_parallel({
+        dataset_name: (lambda n=dataset_name, f=filename: load_peterson_file(n, f, profile))
+        for dataset_name, filename in PETERSON_FILES.items()
+    })
+
+
+def load_peterson_corpus(profile=None):
+    """Load the Peterson datasets and compute each dataset's citation statistics once"""
+    profile = profile or StartupProfile()
+    datasets = load_peterson_datasets(profile)
+    with profile.phase('stats', 'peterson'):
+        stats = {name: citation_statistics(papers) for name, papers in datasets.items()}
+    return {'datasets': datasets, 'stats': stats}
@@ -0,0 +1,104 @@
+"""
+Pre-serialized response cache for the JSON list endpoints
+Each entry holds an encoded body plus a strong ETag, built once and reused
+until the handler that changes the underlying data invalidates it.
+Compressed (gzip/brotli) variants are built at most once per entry: the first
+request that needs one compresses while concurrent requests wait for it.
+"""
+import gzip
+import hashlib
+import threading
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+# Bodies smaller than this are not worth compressing
+MIN_COMPRESS_SIZE = 1024
+
+# Mid-range levels: the top levels cost several times more CPU on multi-megabyte
+# bodies for a few percent smaller output, and run inside a request
+BROTLI_QUALITY = 5
+GZIP_LEVEL = 6
+
+# Content-Encodings we can serve, in order of preference
+SUPPORTED_ENCODINGS = ['br', 'gzip'] if brotli else ['gzip']
+
+
+def compress(body, encoding):
+    """Compress body with the given Content-Encoding"""
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+class CachedBody:
+    """Encoded response body with its strong ETag and precompressed variants"""
+    def __init__(self, body):
+        self.body = body
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        self.variants = {}
+        self.lock = threading.Lock()
+
+    def encoded(self, encoding=None):
+        """Return (body, etag) for a Content-Encoding, compressing on first use"""
+        if not encoding or encoding == 'identity':
+            return self.body, self.etag
+        variant = self.variants.get(encoding)
+        if variant is None:
+            with self.lock:
+                variant = self.variants.get(encoding)
+                if variant is None:
+                    # Each representation gets its own strong ETag
+                    variant = (compress(self.body, encoding), f"{self.etag}-{encoding}")
+                    self.variants[encoding] = variant
+        return variant
+
+    def __len__(self):
+        return len(self.body)
+
+    def __repr__(self):
+        return f"CachedBody(etag='{self.etag}', size={len(self.body)})"
+
+
+class ResponseCache:
+    """Named cache of encoded bodies, optionally split into variants per name"""
+    def __init__(self):
+        self.entries = {}
+        self.generations = {}
+        self.lock = threading.Lock()
+
+    def get(self, name, build, variant=None):
+        """Get the cached body for name/variant, calling build() to encode it on a miss"""
+        key = (name, variant)
+        entry = self.entries.get(key)
+        if entry is not None:
+            return entry
+
+        generation = self.generations.get(name, 0)
+        entry = CachedBody(build())
+        with self.lock:
+            # Only store if the data was not invalidated while we were building
+            if self.generations.get(name, 0) == generation:
+                self.entries[key] = entry
+        return entry
+
+    def invalidate(self, name):
+        """Drop every cached variant for name"""
+        with self.lock:
+            self.generations[name] = self.generations.get(name, 0) + 1
+            for key in [k for k in self.entries if k[0] == name]:
+                del self.entries[key]
+
+    def clear(self):
+        """Drop all cached bodies"""
+        with self.lock:
+            for name in {k[0] for k in self.entries}:
+                self.generations[name] = self.generations.get(name, 0) + 1
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
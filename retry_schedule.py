@@ -0,0 +1,52 @@
+"""
+Cross-run retry schedule for transcript fetches
+A failed episode records its failure class, how many times in a row it has
+failed and when it may next be tried. Videos with transcripts disabled or no
+captions are parked for weeks; transient failures (IP blocks, retrieval
+errors) back off exponentially from run to run. Each run then only spends
+requests on episodes whose next-eligible time has passed.
+"""
+from datetime import datetime, timedelta
+
+PARK_PERIODS = {
+    'disabled': timedelta(days=30),
+    'not_found': timedelta(days=14),
+}
+TRANSIENT_BASE = timedelta(hours=1)
+TRANSIENT_MAX = timedelta(days=7)
+
+
+def retry_delay(failure_class, failures):
+    """How long to wait before the next attempt after `failures` consecutive failures"""
+    if failure_class in PARK_PERIODS:
+        return PARK_PERIODS[failure_class]
+    return min(TRANSIENT_MAX, TRANSIENT_BASE * 2 ** max(0, failures - 1))
+
+
+def schedule_failure(entry, failure_class, previous=None, now=None):
+    """Record a failed fetch on entry, counting on from the previous entry's failures"""
+    now = now or datetime.now()
+    failures = 1
+    if previous and previous.get('transcript_status') != 'success':
+        failures = (previous.get('transcript_failures') or 0) + 1
+    entry['transcript_failure_class'] = failure_class
+    entry['transcript_failures'] = failures
+    entry['transcript_next_eligible_at'] = (now + retry_delay(failure_class, failures)).isoformat()
+    return entry
+
+
+def next_eligible_at(entry):
+    """When the entry may be fetched again (None: now, or never scheduled)"""
+    value = entry.get('transcript_next_eligible_at')
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def is_eligible(entry, now=None):
+    """True if a failed entry's retry time has passed (or it has none)"""
+    eligible_at = next_eligible_at(entry)
+    return eligible_at is None or eligible_at <= (now or datetime.now())
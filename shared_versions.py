@@ -0,0 +1,101 @@
+"""
+Cross-worker data version counters
+Each dataset gets an 8-byte counter slot in a small memory-mapped file shared
+by every gunicorn worker. A worker bumps a counter after persisting a dataset;
+the others compare the counters with the versions they last loaded (a single
+memory read per request) and reload only the datasets that changed.
+"""
+import fcntl
+import mmap
+import os
+import struct
+import threading
+
+SLOT_SIZE = 8
+
+
+class SharedVersions:
+    """Version counters for named datasets, shared between processes via mmap"""
+    def __init__(self, path, names):
+        self.path = path
+        self.names = list(names)
+        self.slots = {name: i for i, name in enumerate(self.names)}
+        self.format = f"<{len(self.names)}Q"
+        self.lock = threading.Lock()
+        self.fd = None
+        self.map = None
+
+        try:
+            self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            size = SLOT_SIZE * len(self.names)
+            with self._file_lock():
+                if os.fstat(self.fd).st_size < size:
+                    os.ftruncate(self.fd, size)
+            self.map = mmap.mmap(self.fd, size)
+        except OSError as e:
+            # e.g. flask_data mounted read-only: fall back to per-worker data
+            print(f"Warning: shared data versions disabled ({path}: {e})")
+            if self.fd is not None:
+                os.close(self.fd)
+                self.fd = None
+
+        self.seen = self.current()
+
+    @property
+    def enabled(self):
+        return self.map is not None
+
+    def _file_lock(self):
+        return _FileLock(self.fd)
+
+    def current(self):
+        """Read every counter from the shared file"""
+        if not self.enabled:
+            return {name: 0 for name in self.names}
+        return dict(zip(self.names, struct.unpack_from(self.format, self.map, 0)))
+
+    def bump(self, name):
+        """Increment a dataset's counter after this worker changed it on disk"""
+        if not self.enabled or name not in self.slots:
+            return None
+        offset = self.slots[name] * SLOT_SIZE
+        with self.lock, self._file_lock():
+            version = struct.unpack_from('<Q', self.map, offset)[0] + 1
+            struct.pack_into('<Q', self.map, offset, version)
+            # This worker already holds the new data
+            self.seen[name] = version
+        return version
+
+    def changed(self):
+        """Return datasets changed by other workers since last checked, marking them seen"""
+        if not self.enabled:
+            return []
+        current = self.current()
+        if current == self.seen:
+            return []
+        with self.lock:
+            stale = [name for name in self.names if current[name] != self.seen.get(name)]
+            self.seen.update({name: current[name] for name in stale})
+        return stale
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+class _FileLock:
+    """Exclusive advisory lock on the versions file (serializes bumps across processes)"""
+    def __init__(self, fd):
+        self.fd = fd
+
+    def __enter__(self):
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        fcntl.flock(self.fd, fcntl.LOCK_UN)
+        return False
@@ -0,0 +1,91 @@
+"""
+Binary snapshot cache for derived datasets
+A derived artifact (e.g. the merged Archimedes corpus) is pickled under a key
+built from the content hashes of its source files plus any build settings.
+While the sources are unchanged the snapshot is loaded directly; when any
+source changes the key changes and the artifact is rebuilt automatically.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+
+from startup import StartupProfile
+
+# Bump when the structure of cached artifacts changes
+SNAPSHOT_SCHEMA = 2
+
+
+def file_digest(filepath, chunk_size=1024 * 1024):
+    """SHA-256 of a file's contents ('missing' if it does not exist)"""
+    digest = hashlib.sha256()
+    try:
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return 'missing'
+    return digest.hexdigest()
+
+
+class SnapshotCache:
+    """Directory of pickled artifacts, one current snapshot per name"""
+    def __init__(self, directory):
+        self.directory = directory
+
+    def source_key(self, paths, settings=()):
+        """Cache key for the given source files and build settings"""
+        digest = hashlib.sha256(f"schema={SNAPSHOT_SCHEMA}".encode('utf-8'))
+        for path in paths:
+            digest.update(f"\n{os.path.basename(path)}={file_digest(path)}".encode('utf-8'))
+        for setting in settings:
+            digest.update(f"\n{setting!r}".encode('utf-8'))
+        return digest.hexdigest()[:24]
+
+    def path(self, name, key):
+        return os.path.join(self.directory, f"{name}-{key}.pickle")
+
+    def load(self, name, key):
+        """Load the snapshot for name/key, or None if missing or unreadable"""
+        try:
+            with open(self.path(name, key), 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: discarding unreadable snapshot {name}: {e}")
+            return None
+
+    def store(self, name, key, value):
+        """Atomically write the snapshot for name/key and remove stale ones"""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{name}.", suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            target = self.path(name, key)
+            os.replace(tmp_path, target)
+        except OSError as e:
+            print(f"Warning: could not write snapshot {name}: {e}")
+            return
+
+        for filename in os.listdir(self.directory):
+            stale = os.path.join(self.directory, filename)
+            if filename.startswith(f"{name}-") and filename.endswith('.pickle') and stale != target:
+                try:
+                    os.unlink(stale)
+                except FileNotFoundError:
+                    pass  # already removed by another worker
+
+    def get_or_build(self, name, paths, build, settings=(), profile=None):
+        """Load the snapshot if the sources are unchanged, otherwise build() and store it"""
+        profile = profile or StartupProfile()
+        with profile.phase('snapshot_hash', name):
+            key = self.source_key(paths, settings)
+        with profile.phase('snapshot_load', name):
+            value = self.load(name, key)
+        if value is None:
+            value = build()
+            with profile.phase('snapshot_store', name):
+                self.store(name, key, value)
+        return value
@@ -0,0 +1,79 @@
+"""
+Startup helpers: parallel JSON loading and a per-phase startup-time profile
+orjson is used for decoding when installed, otherwise the stdlib json module.
+"""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib decoder works everywhere
+    orjson = None
+
+JSON_DECODER = 'orjson' if orjson else 'json'
+
+
+def read_json(filepath):
+    """Read and decode a JSON file with the fastest available decoder"""
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+class StartupProfile:
+    """Wall-clock timings of startup phases (parse, filter, dedup, template warm-up, ...)"""
+    def __init__(self):
+        self.timings = []
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, phase, name=''):
+        """Time the enclosed block as one step of a phase"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, name, time.perf_counter() - start)
+
+    def record(self, phase, name, seconds):
+        with self.lock:
+            self.timings.append((phase, name, seconds))
+
+    def totals(self):
+        """Summed seconds per phase (parallel steps overlap, so this can exceed wall time)"""
+        totals = {}
+        for phase, _, seconds in self.timings:
+            totals[phase] = totals.get(phase, 0.0) + seconds
+        return totals
+
+    def to_dict(self):
+        return {
+            'decoder': JSON_DECODER,
+            'phases': {phase: round(seconds, 4) for phase, seconds in self.totals().items()},
+            'steps': [
+                {'phase': phase, 'name': name, 'seconds': round(seconds, 4)}
+                for phase, name, seconds in self.timings
+            ]
+        }
+
+    def report(self):
+        """Human-readable startup profile"""
+        lines = [f"Startup profile (JSON decoder: {JSON_DECODER})", "=" * 60]
+        for phase, seconds in self.totals().items():
+            lines.append(f"{phase:<20} {seconds * 1000:>10.1f} ms")
+        lines.append("-" * 60)
+        for phase, name, seconds in self.timings:
+            lines.append(f"  {phase:<18} {name:<28} {seconds * 1000:>8.1f} ms")
+        return "\n".join(lines)
+
+
+def load_parallel(loaders, max_workers=8):
+    """Run independent loaders concurrently: {key: callable} -> {key: result}"""
+    if not loaders:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(loaders))) as executor:
+        futures = {key: executor.submit(loader) for key, loader in loaders.items()}
+        return {key: future.result() for key, future in futures.items()}
@@ -2,15 +2,54 @@
 Test suite for Flask application
 """
 import pytest
+import gzip
 import json
 import os
+import pickle
+import shutil
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
-from app import app, PROJECTS, PUBLICATIONS, ABOUT, CONTACT, NAVIGATION, READING_LIST, contact_services
+import app as app_module
+from app import app, PROJECTS, READING_LIST, WRITING, PODCASTS, contact_services
+from record_registry import RecordRegistry
+from persistence import WriteBehindWriter
+from rate_limit import AdaptiveRateController, TokenBucket, classify_fetch_error
+from retry_schedule import is_eligible, schedule_failure
+from transcript_store import TranscriptStore
+from shared_versions import SharedVersions
+from lazy_dataset import LazyDataset
+from file_watcher import FileWatcher
+from concept_filter import ConceptFilter
+from research_data import MEDICAL_EXCLUDE_CONCEPTS, merge_archimedes_papers
+from snapshot_cache import SnapshotCache
+from paper_index import PaperIndex
+from citation_stats import archimedes_stats, citation_statistics
+from citation_graph import CitationGraph
+from dataset_sets import DatasetSets
+from paper_store import Paper, SourcedPaper
 
 # Load environment variables for testing
 load_dotenv()
 
 
+@pytest.fixture(autouse=True, scope='session')
+def isolated_snapshot_cache(tmp_path_factory):
+    """Keep Archimedes snapshots out of the repo's .cache/ so one run cannot change the next"""
+    from research_data import ARCHIMEDES_SNAPSHOTS
+    original = ARCHIMEDES_SNAPSHOTS.directory
+    ARCHIMEDES_SNAPSHOTS.directory = str(tmp_path_factory.mktemp('snapshots'))
+    yield
+    ARCHIMEDES_SNAPSHOTS.directory = original
+
+
+@pytest.fixture(autouse=True, scope='session')
+def site_app(tmp_path_factory):
+    """Initialize the app once on a temporary copy of flask_data, so tests never write the real files"""
+    data_dir = tmp_path_factory.mktemp('data') / 'flask_data'
+    shutil.copytree(os.path.join(os.path.dirname(app_module.__file__), 'flask_data'), data_dir)
+    return app_module.create_app(data_dir=str(data_dir))
+
+
 @pytest.fixture
 def client():
     """Create test client"""
@@ -47,31 +86,31 @@ class TestDataStructures:
         """Validate all publications have required fields"""
         required_keys = ['title', 'status', 'description']
         
-        assert len(PUBLICATIONS) > 0, "No publications loaded"
+        assert len(app_module.PUBLICATIONS) > 0, "No publications loaded"
         
-        for pub in PUBLICATIONS:
+        for pub in app_module.PUBLICATIONS:
             for key in required_keys:
                 assert key in pub, f"Publication {pub.get('title', 'unknown')} missing key: {key}"
     
     def test_about_structure(self):
         """Validate about data structure"""
-        assert isinstance(ABOUT, dict), "ABOUT must be a dictionary"
-        assert len(ABOUT) > 0, "ABOUT data is empty"
+        assert isinstance(app_module.ABOUT, dict), "ABOUT must be a dictionary"
+        assert len(app_module.ABOUT) > 0, "ABOUT data is empty"
     
     def test_contact_structure(self):
         """Validate contact data structure"""
-        assert isinstance(CONTACT, dict), "CONTACT must be a dictionary"
-        assert len(CONTACT) > 0, "CONTACT data is empty"
+        assert isinstance(app_module.CONTACT, dict), "CONTACT must be a dictionary"
+        assert len(app_module.CONTACT) > 0, "CONTACT data is empty"
     
     def test_navigation_structure(self):
         """Validate navigation data structure"""
-        assert isinstance(NAVIGATION, dict), "NAVIGATION must be a dictionary"
-        assert 'links' in NAVIGATION, "NAVIGATION must have links key"
-        assert isinstance(NAVIGATION['links'], list), "NAVIGATION links must be a list"
-        assert len(NAVIGATION['links']) > 0, "NAVIGATION links cannot be empty"
+        assert isinstance(app_module.NAVIGATION, dict), "NAVIGATION must be a dictionary"
+        assert 'links' in app_module.NAVIGATION, "NAVIGATION must have links key"
+        assert isinstance(app_module.NAVIGATION['links'], list), "NAVIGATION links must be a list"
+        assert len(app_module.NAVIGATION['links']) > 0, "NAVIGATION links cannot be empty"
         
         # Validate each link
-        for link in NAVIGATION['links']:
+        for link in app_module.NAVIGATION['links']:
             assert 'label' in link, "Each link must have a label"
             assert 'url' in link, "Each link must have a url"
             assert 'external' in link, "Each link must have external flag"
@@ -133,6 +172,21 @@ class TestWebRoutes:
         data = response.get_json()
         assert data['ok'] is True
     
+    def test_readyz_endpoint(self, client):
+        """Test readiness endpoint reports per-dataset load state"""
+        from app import RESEARCH_DATASETS
+        for dataset in RESEARCH_DATASETS:
+            dataset.get()
+        
+        response = client.get('/readyz')
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['ready'] is True
+        for dataset in RESEARCH_DATASETS:
+            status = data['datasets'][dataset.name]
+            assert status['state'] == 'ready'
+            assert status['load_seconds'] is not None
+    
     def test_project_detail_routes(self, client):
         """Test all project detail pages load"""
         for project in PROJECTS:
@@ -188,7 +242,7 @@ class TestAPIEndpoints:
         assert response.status_code == 200
         data = response.get_json()
         assert isinstance(data, list)
-        assert len(data) == len(PUBLICATIONS)
+        assert len(data) == len(app_module.PUBLICATIONS)
     
     def test_api_about(self, client, auth_headers):
         """Test about API endpoint"""
@@ -243,6 +297,213 @@ class TestAPIEndpoints:
         assert data['item']['title'] == 'Test Book'
         assert data['total_items'] == initial_count + 1
     
+    def test_api_list_etag_not_modified(self, client, auth_headers):
+        """Test list endpoints send a strong ETag and answer If-None-Match with 304"""
+        for route in ['/api/projects', '/api/publications', '/api/podcasts', '/api/writing', '/api/reading-list']:
+            response = client.get(route, headers=auth_headers)
+            assert response.status_code == 200
+            etag = response.headers['ETag']
+            assert not etag.startswith('W/')
+            
+            cached = client.get(route, headers={**auth_headers, 'If-None-Match': etag})
+            assert cached.status_code == 304, f"{route} did not return 304"
+            assert cached.data == b''
+    
+    def test_api_podcasts_gzip(self, client):
+        """Test large cached bodies are served precompressed with their own ETag"""
+        plain = client.get('/api/podcasts')
+        compressed = client.get('/api/podcasts', headers={'Accept-Encoding': 'gzip'})
+        assert compressed.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in compressed.headers['Vary']
+        assert gzip.decompress(compressed.data) == plain.data
+        assert compressed.headers['ETag'] != plain.headers['ETag']
+        
+        cached = client.get('/api/podcasts', headers={'Accept-Encoding': 'gzip',
+                                                      'If-None-Match': compressed.headers['ETag']})
+        assert cached.status_code == 304
+    
+    def test_cached_body_compresses_once(self, monkeypatch):
+        """Test concurrent first requests share one compression of a cached body"""
+        import threading
+        import time
+        import response_cache
+        calls = []
+        
+        def slow_compress(body, encoding):
+            calls.append(encoding)
+            time.sleep(0.05)
+            return gzip.compress(body)
+        
+        monkeypatch.setattr(response_cache, 'compress', slow_compress)
+        entry = response_cache.CachedBody(b'x' * 4096)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(entry.encoded('gzip'))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert calls == ['gzip']
+        assert len(set(results)) == 1
+    
+    def test_api_reading_list_cache_invalidated(self, client, auth_headers):
+        """Test adding a reading list item changes the cached body and ETag"""
+        before = client.get('/api/reading-list', headers=auth_headers)
+        
+        client.post('/api/reading-list/add',
+                    data=json.dumps({'title': 'Cache Test', 'categories': ['Test']}),
+                    headers=auth_headers,
+                    content_type='application/json')
+        
+        after = client.get('/api/reading-list', headers={**auth_headers, 'If-None-Match': before.headers['ETag']})
+        assert after.status_code == 200
+        assert after.headers['ETag'] != before.headers['ETag']
+        assert len(after.get_json()) == len(before.get_json()) + 1
+    
+    def test_api_podcasts_projection(self, client):
+        """Test field projection and exclusion on podcasts API"""
+        response = client.get('/api/podcasts?fields=id,title')
+        assert response.status_code == 200
+        data = response.get_json()
+        assert len(data) == len(PODCASTS)
+        for episode in data:
+            assert set(episode) <= {'id', 'title'}
+        
+        response = client.get('/api/podcasts?exclude=transcript,transcript_segments')
+        for episode in response.get_json():
+            assert 'transcript' not in episode
+            assert 'transcript_segments' not in episode
+    
+    def test_api_podcasts_cache_shapes_bounded(self, client):
+        """Test arbitrary projections are not cached and equivalent excludes share one entry"""
+        from app import response_cache
+        response_cache.invalidate('podcasts')
+        for n in range(20):
+            response = client.get(f'/api/podcasts?exclude=junk{n}')
+            assert response.status_code == 200
+            assert len(response.get_json()) == len(PODCASTS)
+        client.get('/api/podcasts?fields=id')
+        client.get('/api/podcasts?exclude=title')
+        # Unknown names are dropped, so every junk exclude is the default shape
+        assert [key for key in response_cache.entries if key[0] == 'podcasts'] == [('podcasts', ())]
+        
+        client.get('/api/podcasts?exclude=transcript_segments,transcript')
+        client.get('/api/podcasts?exclude=transcript,junk,transcript_segments,transcript')
+        assert sorted(key for key in response_cache.entries if key[0] == 'podcasts') == \
+            [('podcasts', ()), ('podcasts', ('transcript', 'transcript_segments'))]
+    
+    def test_api_podcasts_cursor_pagination(self, client):
+        """Test walking the podcasts API with limit and cursor"""
+        seen = []
+        url = '/api/podcasts?fields=id&limit=3'
+        while True:
+            response = client.get(url)
+            assert response.status_code == 200
+            assert response.headers['X-Total-Count'] == str(len(PODCASTS))
+            page = response.get_json()
+            assert len(page) <= 3
+            seen.extend(p['id'] for p in page)
+            cursor = response.headers.get('X-Next-Cursor')
+            if not cursor:
+                break
+            url = f'/api/podcasts?fields=id&limit=3&cursor={cursor}'
+        assert seen == [p['id'] for p in PODCASTS]
+    
+    def test_api_podcasts_ndjson_stream(self, client):
+        """Test podcasts API streams one JSON record per line"""
+        for response in [client.get('/api/podcasts?stream=1&fields=id'),
+                         client.get('/api/podcasts?fields=id', headers={'Accept': 'application/x-ndjson'})]:
+            assert response.status_code == 200
+            assert response.mimetype == 'application/x-ndjson'
+            lines = response.data.decode('utf-8').splitlines()
+            assert [json.loads(line)['id'] for line in lines] == [p['id'] for p in PODCASTS]
+    
+    def test_api_archimedes_papers_ndjson(self, client, auth_headers):
+        """Test Archimedes papers API supports NDJSON streaming"""
+        response = client.get('/api/archimedes/papers?stream=1', headers=auth_headers)
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        assert len(response.data.decode('utf-8').splitlines()) == int(response.headers['X-Total-Count'])
+    
+    def test_api_archimedes_papers_search(self, client, auth_headers):
+        """Test Archimedes papers API accepts search, filter, sort and paging params"""
+        response = client.get('/api/archimedes/papers?q=rotation&year_from=1980&sort=year&limit=5',
+                              headers=auth_headers)
+        assert response.status_code == 200
+        assert 'X-Total-Count' in response.headers
+        assert len(response.get_json()) <= 5
+        assert client.get('/api/archimedes/papers?sort=abstract', headers=auth_headers).status_code == 400
+        assert client.get('/api/archimedes/papers?year_from=abc', headers=auth_headers).status_code == 400
+        assert client.get('/archimedes/search?limit=5').status_code == 200
+    
+    def test_api_archimedes_stats(self, client, auth_headers):
+        """Test Archimedes stats API serves one cached statistics document"""
+        response = client.get('/api/archimedes/stats', headers=auth_headers)
+        assert response.status_code == 200
+        stats = response.get_json()
+        for key in ['total_papers', 'citations', 'per_year', 'top_cited', 'datasets', 'overlaps', 'concepts']:
+            assert key in stats
+        cached = client.get('/api/archimedes/stats', headers={**auth_headers, 'If-None-Match': response.headers['ETag']})
+        assert cached.status_code == 304
+    
+    def test_api_citation_graph(self, client, auth_headers):
+        """Test citation graph endpoints respond and validate their params"""
+        for url in ['/api/archimedes/graph', '/api/archimedes/graph/degrees',
+                    '/api/archimedes/graph/pagerank?limit=5', '/api/archimedes/graph/components']:
+            assert client.get(url, headers=auth_headers).status_code == 200, url
+        
+        # Any ?limit= is a slice of one ranking per graph, not another cached response
+        from app import response_cache
+        top = client.get('/api/archimedes/graph/pagerank?limit=10', headers=auth_headers).get_json()
+        for limit in range(1, 6):
+            page = client.get(f'/api/archimedes/graph/pagerank?limit={limit}', headers=auth_headers).get_json()
+            assert page == top[:limit]
+            client.get(f'/api/archimedes/graph/components?limit={limit}', headers=auth_headers)
+        assert not [key for key in response_cache.entries
+                    if key[0] in ('citation_graph_pagerank', 'citation_graph_components')]
+        assert client.get('/api/archimedes/graph/neighborhood', headers=auth_headers).status_code == 400
+        assert client.get('/api/archimedes/graph/neighborhood?node=x&k=9', headers=auth_headers).status_code == 400
+        assert client.get('/api/archimedes/graph/neighborhood?node=no-such-paper',
+                          headers=auth_headers).status_code == 404
+    
+    def test_api_peterson_network_metadata(self, client, auth_headers):
+        """Test Peterson network metadata carries computed citation statistics"""
+        response = client.get('/api/archimedes/peterson/network', headers=auth_headers)
+        assert response.status_code == 200
+        metadata = response.get_json()['metadata']
+        assert metadata['total_papers'] == len(response.get_json()['papers'])
+        for key in ['average_citations', 'median_citations', 'citation_percentiles', 'h_index', 'year_histogram']:
+            assert key in metadata
+    
+    def test_api_peterson_citations_metadata_shape(self, client, auth_headers):
+        """Test Peterson citations metadata keeps datasets as {name: paper count}, statistics alongside"""
+        response = client.get('/api/archimedes/peterson/citations', headers=auth_headers)
+        assert response.status_code == 200
+        metadata = response.get_json()['metadata']
+        assert set(metadata['datasets']) == {'peterson_network', 'peterson_papers', 'maps_of_meaning',
+                                             'maps_of_meaning_curated'}
+        assert all(type(count) is int for count in metadata['datasets'].values())
+        for name, stats in metadata['statistics'].items():
+            assert stats['total_papers'] == metadata['datasets'].get(name, stats['total_papers'])
+            assert 'h_index' in stats
+    
+    def test_api_dataset_sets(self, client, auth_headers):
+        """Test set algebra endpoint lists datasets and validates params"""
+        response = client.get('/api/archimedes/sets', headers=auth_headers)
+        assert response.status_code == 200
+        names = ','.join(list(response.get_json())[:2])
+        response = client.get(f'/api/archimedes/sets?op=union&datasets={names}&limit=5', headers=auth_headers)
+        assert response.status_code == 200
+        assert 'X-Total-Count' in response.headers
+        assert client.get('/api/archimedes/sets?op=xor&datasets=overlap_citations',
+                          headers=auth_headers).status_code == 400
+        assert client.get('/api/archimedes/sets?datasets=nope', headers=auth_headers).status_code == 404
+    
+    def test_api_podcasts_invalid_paging(self, client):
+        """Test malformed cursor and limit values are rejected"""
+        assert client.get('/api/podcasts?cursor=not-a-cursor').status_code == 400
+        assert client.get('/api/podcasts?limit=0').status_code == 400
+        assert client.get('/api/podcasts?limit=abc').status_code == 400
+    
     def test_api_contact_microservices(self, client, auth_headers):
         """Test contact microservice API endpoints"""
         services = ['research', 'speaking', 'consulting', 'collaboration']
@@ -301,6 +562,66 @@ class TestAPIEndpoints:
         assert 'error' in data
 
 
+class TestResumeContent:
+    """Test session-protected resume content endpoint"""
+    
+    def test_resume_content_requires_code(self, client):
+        """Test resume content is denied without a validated code"""
+        response = client.get('/api/resume/content')
+        assert response.status_code == 403
+    
+    def test_resume_content_body_fragment(self, client):
+        """Test resume content returns only the extracted body fragment"""
+        with client.session_transaction() as sess:
+            sess['resume_access'] = True
+        
+        response = client.get('/api/resume/content')
+        assert response.status_code == 200
+        content = response.get_json()['content']
+        assert content
+        assert '<body>' not in content
+        assert '</html>' not in content
+        
+        cached = client.get('/api/resume/content', headers={'If-None-Match': response.headers['ETag']})
+        assert cached.status_code == 304
+
+
+class TestGorgonEndpoints:
+    """Test password-protected Project Gorgon file-backed endpoints"""
+    
+    @pytest.fixture
+    def gorgon_headers(self):
+        return {'X-Gorgon-Password': os.getenv('GORGON_PASSWORD', 'ARCHIMEDES2026')}
+    
+    def test_gorgon_requires_password(self, client):
+        """Test Gorgon endpoints reject missing password"""
+        assert client.get('/gorgon/peterson-podcasts.json').status_code == 403
+        assert client.get('/gorgon/peterson-basic-stats').status_code == 403
+    
+    def test_gorgon_podcasts_revalidation(self, client, gorgon_headers):
+        """Test Gorgon episode list sends validators and answers 304"""
+        response = client.get('/gorgon/peterson-podcasts.json', headers=gorgon_headers)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['project'] == 'GORGON'
+        assert data['total_episodes'] == len(data['episodes'])
+        assert 'Last-Modified' in response.headers
+        
+        cached = client.get('/gorgon/peterson-podcasts.json',
+                            headers={**gorgon_headers, 'If-None-Match': response.headers['ETag']})
+        assert cached.status_code == 304
+    
+    def test_gorgon_stats_revalidation(self, client, gorgon_headers):
+        """Test Gorgon stats page honours If-Modified-Since"""
+        response = client.get('/gorgon/peterson-basic-stats', headers=gorgon_headers)
+        assert response.status_code == 200
+        assert response.mimetype == 'text/html'
+        
+        cached = client.get('/gorgon/peterson-basic-stats',
+                            headers={**gorgon_headers, 'If-Modified-Since': response.headers['Last-Modified']})
+        assert cached.status_code == 304
+
+
 class TestLinkedListImplementation:
     """Test contact linked list implementation"""
     
@@ -344,3 +665,612 @@ class TestLinkedListImplementation:
         """Test linked list length"""
         assert len(contact_services) > 0
         assert len(contact_services) == contact_services.size
+
+
+class TestRecordRegistry:
+    """Test id-indexed record registry implementation"""
+    
+    def test_registry_get(self):
+        """Test O(1) lookup matches the record list"""
+        for project in PROJECTS:
+            assert PROJECTS.get(project['id']) is project
+        assert PROJECTS.get('nonexistent-project-xyz') is None
+    
+    def test_registry_append_and_remove(self):
+        """Test index stays in sync with appends and removals"""
+        registry = RecordRegistry([{'id': 'a'}, {'id': 'b'}])
+        registry.append({'id': 'c'})
+        assert 'c' in registry
+        assert len(registry) == 3
+        
+        removed = registry.remove('a')
+        assert removed == {'id': 'a'}
+        assert 'a' not in registry
+        assert [r['id'] for r in registry] == ['b', 'c']
+        assert registry.remove('a') is None
+    
+    def test_registry_replace_in_place(self):
+        """Test replace keeps the same list object and rebuilds the index"""
+        registry = RecordRegistry([{'id': 1}])
+        records = registry.to_list()
+        registry.replace([{'id': 2}, {'id': 3}])
+        assert registry.to_list() is records
+        assert 1 not in registry
+        assert registry.get(3) == {'id': 3}
+        assert max(registry.ids()) == 3
+    
+    def test_registry_first_duplicate_wins(self):
+        """Test duplicate ids resolve to the first record, like a linear scan"""
+        registry = RecordRegistry([{'id': 'x', 'n': 1}, {'id': 'x', 'n': 2}])
+        assert registry.get('x')['n'] == 1
+    
+    def test_api_writing_detail(self, client):
+        """Test writing detail API uses the registry"""
+        for post in WRITING:
+            response = client.get(f'/api/writing/{post["id"]}')
+            assert response.status_code == 200
+            assert response.get_json()['id'] == post['id']
+
+
+class TestWriteBehindPersistence:
+    """Test coalesced, atomic write-behind persistence"""
+    
+    def test_writes_coalesce_and_flush(self, tmp_path):
+        """Test rapid saves collapse into one write that flush() waits for"""
+        writer = WriteBehindWriter(str(tmp_path), delay=0.05)
+        written = []
+        writer.add_listener(written.append)
+        
+        items = []
+        for i in range(20):
+            items.append({'id': i})
+            writer.schedule('items.json', lambda: items)
+        
+        assert writer.flush(timeout=5)
+        assert json.loads((tmp_path / 'items.json').read_text()) == items
+        assert written == ['items.json']
+    
+    def test_atomic_write_leaves_no_temp_files(self, tmp_path):
+        """Test synchronous writes are compact and leave only the target file"""
+        writer = WriteBehindWriter(str(tmp_path))
+        writer.write('data.json', {'a': [1, 2]})
+        assert (tmp_path / 'data.json').read_text() == '{"a":[1,2]}'
+        assert os.listdir(tmp_path) == ['data.json']
+
+
+class TestSharedVersions:
+    """Test cross-worker data version counters"""
+    
+    def test_bump_visible_to_other_workers(self, tmp_path):
+        """Test a bump in one worker is reported once by another"""
+        path = str(tmp_path / 'versions')
+        worker_a = SharedVersions(path, ['projects.json', 'writing.json'])
+        worker_b = SharedVersions(path, ['projects.json', 'writing.json'])
+        
+        assert worker_a.bump('writing.json') == 1
+        assert worker_a.changed() == []
+        assert worker_b.changed() == ['writing.json']
+        assert worker_b.changed() == []
+        
+        worker_a.close()
+        worker_b.close()
+    
+    def test_unknown_dataset_ignored(self, tmp_path):
+        """Test bumping a name without a slot is a no-op"""
+        versions = SharedVersions(str(tmp_path / 'versions'), ['projects.json'])
+        assert versions.bump('unknown.json') is None
+        assert versions.changed() == []
+        versions.close()
+    
+    def test_app_reloads_changed_dataset(self, client, auth_headers):
+        """Test the app reloads a dataset when another worker bumps its version"""
+        from app import shared_versions
+        other_worker = SharedVersions(shared_versions.path, list(shared_versions.names))
+        other_worker.bump('publications.json')
+        
+        response = client.get('/api/publications', headers=auth_headers)
+        assert response.status_code == 200
+        assert shared_versions.changed() == []
+        other_worker.close()
+
+
+class TestLazyDataset:
+    """Test lazily loaded dataset state tracking"""
+    
+    def test_loads_once_on_first_use(self):
+        """Test the loader runs on first get() only"""
+        calls = []
+        dataset = LazyDataset('numbers', lambda: calls.append(1) or [1, 2, 3])
+        assert dataset.status()['state'] == 'pending'
+        assert dataset.get() == [1, 2, 3]
+        assert dataset.get() == [1, 2, 3]
+        assert len(calls) == 1
+        assert dataset.ready
+        assert dataset.version == 1
+    
+    def test_failed_load_is_reported_and_retried(self):
+        """Test a failing loader marks the dataset failed and retries on next use"""
+        attempts = []
+        
+        def loader():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OSError('disk unavailable')
+            return {'ok': True}
+        
+        dataset = LazyDataset('flaky', loader)
+        with pytest.raises(OSError):
+            dataset.get()
+        assert dataset.status()['state'] == 'failed'
+        assert dataset.status()['error'] == 'disk unavailable'
+        assert dataset.get() == {'ok': True}
+    
+    def test_reload_swaps_snapshot_and_keeps_old_value_on_failure(self):
+        """Test reload() swaps in a new (version, value) and survives a failing rebuild"""
+        source = {'value': 'v1'}
+        
+        def loader():
+            if source['value'] is None:
+                raise ValueError('bad file')
+            return source['value']
+        
+        dataset = LazyDataset('reloadable', loader)
+        assert dataset.current() == (1, 'v1')
+        source['value'] = 'v2'
+        assert dataset.reload()
+        assert dataset.current() == (2, 'v2')
+        source['value'] = None
+        assert not dataset.reload()
+        assert dataset.current() == (2, 'v2')
+        assert dataset.status()['error'] == 'bad file'
+    
+    def test_file_watcher_waits_for_writes_to_settle(self, tmp_path):
+        """Test the watcher fires once a changed file is stable across two polls"""
+        source = tmp_path / 'papers.json'
+        source.write_text('[]')
+        reloads = []
+        watcher = FileWatcher(interval=0)
+        watcher.watch('papers', lambda: [str(source)], lambda: reloads.append(1))
+        
+        assert watcher.poll() == []
+        source.write_text('[1, 2]')
+        assert watcher.poll() == []          # changed, not yet settled
+        assert watcher.poll() == ['papers']  # unchanged since last poll
+        assert watcher.poll() == []
+        assert len(reloads) == 1
+        
+        source.unlink()
+        watcher.poll()
+        assert watcher.poll() == ['papers']
+    
+    def test_reload_retried_while_first_load_runs(self, tmp_path):
+        """Test a change seen during the initial load is reloaded once the load finishes"""
+        import threading
+        from app import reload_research_dataset
+        source = tmp_path / 'papers.json'
+        source.write_text('"old"')
+        started, release = threading.Event(), threading.Event()
+        
+        def loader():
+            value = json.loads(source.read_text())
+            started.set()
+            release.wait(5)
+            return value
+        
+        dataset = LazyDataset('peterson', loader)
+        watcher = FileWatcher(interval=0)
+        watcher.watch('papers', lambda: [str(source)], lambda: reload_research_dataset(dataset))
+        loading = threading.Thread(target=dataset.get)
+        loading.start()
+        started.wait(5)
+        
+        source.write_text('"new data"')
+        watcher.poll()
+        assert watcher.poll() == []  # first load still running: change kept pending
+        release.set()
+        loading.join(5)
+        assert dataset.get() == 'old'
+        assert watcher.poll() == ['papers']
+        assert dataset.get() == 'new data'
+
+
+class TestStartup:
+    """Test app factory and startup profiling"""
+    
+    def test_create_app_is_idempotent(self):
+        """Test create_app returns the initialized app without reloading"""
+        from app import create_app
+        contact_count = len(contact_services)
+        assert create_app() is app
+        assert len(contact_services) == contact_count
+    
+    def test_import_does_not_load_data(self):
+        """Test importing app only defines it; create_app() does the loading"""
+        import subprocess
+        import sys
+        code = "import app; print(len(app.PROJECTS), 'startup_profile' in app.app.extensions)"
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                cwd=os.path.dirname(app_module.__file__), check=True)
+        assert result.stdout.split()[-2:] == ['0', 'False']
+    
+    def test_startup_profile_command(self):
+        """Test startup-profile CLI prints per-phase timings"""
+        result = app.test_cli_runner().invoke(args=['startup-profile'])
+        assert result.exit_code == 0
+        assert 'Startup profile' in result.output
+        
+        # filter/dedup only run when the corpus is built rather than loaded from its snapshot
+        steps = {(phase, name) for phase, name, _ in app.extensions['startup_profile'].timings}
+        assert ('snapshot_load', 'archimedes_corpus') in steps
+        expected = ['parse', 'template_warmup', 'snapshot_load', 'index']
+        if ('snapshot_store', 'archimedes_corpus') in steps:
+            expected += ['filter', 'dedup']
+        for phase in expected:
+            assert phase in result.output
+    
+    def test_archimedes_snapshot_skips_build(self, tmp_path, monkeypatch):
+        """Test the second corpus load comes from the snapshot without filter/dedup"""
+        from research_data import ARCHIMEDES_SNAPSHOTS, load_archimedes_corpus
+        from startup import StartupProfile
+        monkeypatch.setattr(ARCHIMEDES_SNAPSHOTS, 'directory', str(tmp_path))
+        
+        built, loaded = StartupProfile(), StartupProfile()
+        first = load_archimedes_corpus(built)
+        second = load_archimedes_corpus(loaded)
+        assert {'filter', 'dedup', 'snapshot_store'} <= set(built.totals())
+        assert not {'filter', 'dedup', 'snapshot_store'} & set(loaded.totals())
+        assert len(second['papers']) == len(first['papers'])
+
+
+class TestArchimedesFilters:
+    """Test Archimedes concept filter and merge pipeline"""
+    
+    def test_concept_filter_matches_substring_scan(self):
+        """Test compiled filter agrees with a per-term substring scan"""
+        concept_filter = ConceptFilter(MEDICAL_EXCLUDE_CONCEPTS)
+        samples = [
+            ['Psychology', 'Mental rotation'],
+            ['Medicine', 'Psychology'],
+            ['Computed Tomography'],
+            ['Cognitive science', 'Organization'],  # 'organ' as a substring
+            ['CT', 'Scan'],                           # 'ct scan' across two concepts
+            [],
+        ]
+        for concepts in samples:
+            joined = ' '.join(c.lower() for c in concepts)
+            expected = any(term in joined for term in MEDICAL_EXCLUDE_CONCEPTS)
+            assert concept_filter.excludes(concepts) == expected, concepts
+            assert concept_filter.excludes(concepts) == expected, concepts  # memoized
+    
+    def test_concept_filter_configurable(self, tmp_path):
+        """Test exclusion terms can be loaded from a JSON file"""
+        terms_file = tmp_path / 'terms.json'
+        terms_file.write_text(json.dumps(['Robotics']))
+        concept_filter = ConceptFilter.from_file(str(terms_file))
+        assert concept_filter.excludes(['robotics'])
+        assert not concept_filter.excludes(['Medicine'])
+    
+    def test_merge_filters_and_deduplicates(self):
+        """Test merge drops pre-1972 and medical papers and deduplicates by DOI/title"""
+        datasets = {
+            'a': [
+                {'title': 'Rotation', 'doi': '10.1/x', 'year': 1980, 'concepts': ['Psychology']},
+                {'title': 'Old', 'year': 1965, 'concepts': []},
+                {'title': 'Lungs', 'year': 1990, 'concepts': ['Pulmonary function']},
+            ],
+            'b': [
+                {'title': 'Rotation again', 'doi': '10.1/x', 'year': 1981, 'concepts': []},
+                {'title': 'Spatial ability', 'year': 2001, 'concepts': ['Education']},
+            ],
+        }
+        papers = merge_archimedes_papers(datasets)
+        assert [(p['title'], p['source_dataset']) for p in papers] == [('Rotation', 'a'), ('Spatial ability', 'b')]
+        assert 'source_dataset' not in datasets['a'][0]
+    
+    def test_compact_paper_records(self):
+        """Test Paper/SourcedPaper behave like read-only paper dicts and serialize as JSON objects"""
+        raw = {'title': 'Rotation', 'year': 1980, 'authors': ['A. Author'], 'concepts': ['Psychology'],
+               'language': 'en'}
+        paper = Paper(raw)
+        assert paper['title'] == 'Rotation' and paper.get('doi') is None and 'doi' not in paper
+        assert paper.get('language') == 'en' and 'language' in paper
+        assert paper['concepts'] == ('Psychology',)
+        assert dict(paper) == {**raw, 'authors': ('A. Author',), 'concepts': ('Psychology',)}
+        assert pickle.loads(pickle.dumps(paper)) == paper
+        
+        sourced = SourcedPaper(paper, 'a')
+        assert sourced['source_dataset'] == 'a' and sourced['year'] == 1980
+        assert 'source_dataset' not in paper
+        with app.app_context():
+            assert json.loads(app.json.dumps(sourced)) == {**raw, 'source_dataset': 'a'}
+    
+    def test_snapshot_cache_rebuilds_on_source_change(self, tmp_path):
+        """Test snapshots are reused until a source file's contents change"""
+        source = tmp_path / 'papers.json'
+        source.write_text('[1, 2]')
+        snapshots = SnapshotCache(str(tmp_path / 'cache'))
+        builds = []
+        
+        def build():
+            builds.append(1)
+            return json.loads(source.read_text())
+        
+        assert snapshots.get_or_build('corpus', [str(source)], build) == [1, 2]
+        assert snapshots.get_or_build('corpus', [str(source)], build) == [1, 2]
+        assert len(builds) == 1
+        
+        source.write_text('[1, 2, 3]')
+        assert snapshots.get_or_build('corpus', [str(source)], build) == [1, 2, 3]
+        assert len(builds) == 2
+        assert len(os.listdir(tmp_path / 'cache')) == 1
+    
+    def test_paper_index_search(self):
+        """Test index search agrees with filtering and sorting the papers directly"""
+        papers = [
+            {'title': 'Mental rotation of three-dimensional objects', 'year': 1971, 'cited_by_count': 5000,
+             'concepts': ['Mental rotation'], 'source_dataset': 'a'},
+            {'title': 'Spatial ability in children', 'abstract': 'Rotation tasks in schools', 'year': 1995,
+             'cited_by_count': 40, 'concepts': ['Education'], 'source_dataset': 'b'},
+            {'title': 'Sex differences in rotation', 'year': 1985, 'cited_by_count': 300,
+             'concepts': ['Psychology', 'Mental rotation'], 'source_dataset': 'b'},
+            {'title': 'Untitled draft', 'cited_by_count': None},
+        ]
+        index = PaperIndex(papers)
+        titles = lambda results: [p['title'] for p in results]
+        
+        assert titles(index.search(q='rotat', sort='cited_by_count')) == [
+            'Mental rotation of three-dimensional objects', 'Sex differences in rotation', 'Spatial ability in children']
+        assert titles(index.search(q='rotation schools')) == ['Spatial ability in children']
+        assert titles(index.search(year_from=1980, year_to=1990)) == ['Sex differences in rotation']
+        assert titles(index.search(dataset='b', sort='year', descending=False)) == [
+            'Sex differences in rotation', 'Spatial ability in children']
+        assert titles(index.search(concept='mental rotation', q='sex')) == ['Sex differences in rotation']
+        assert index.search(q='nonexistent') == []
+        assert titles(index.search(sort='cited_by_count'))[-1] == 'Untitled draft'
+    
+    def test_archimedes_stats(self):
+        """Test aggregate statistics over a small corpus"""
+        datasets = {
+            'a': [{'title': 'One', 'doi': '10.1/one'}, {'title': 'Two'}],
+            'b': [{'title': 'One again', 'doi': '10.1/one'}, {'title': 'Three'}],
+        }
+        papers = [
+            {'title': 'One', 'year': 1980, 'cited_by_count': 100, 'concepts': ['Psychology'], 'source_dataset': 'a'},
+            {'title': 'Two', 'year': 1980, 'cited_by_count': 10, 'concepts': ['Psychology', 'Education'],
+             'source_dataset': 'a'},
+            {'title': 'Three', 'year': 1990, 'cited_by_count': None, 'source_dataset': 'b'},
+        ]
+        stats = archimedes_stats(papers, datasets)
+        assert stats['total_papers'] == 3
+        assert stats['year_range'] == [1980, 1990]
+        assert stats['citations']['total'] == 110
+        assert stats['citations']['median'] == 10
+        assert stats['per_year'] == {'years': [1980, 1990], 'papers': [2, 1], 'citations': [110, 0],
+                                     'cumulative_papers': [2, 3]}
+        assert [p['title'] for p in stats['top_cited']] == ['One', 'Two', 'Three']
+        assert stats['datasets']['b'] == {'papers': 2, 'unique_papers': 1}
+        assert stats['overlaps'] == [{'datasets': ['a', 'b'], 'papers': 1}]
+        assert stats['concepts'][0] == {'concept': 'Psychology', 'papers': 2}
+        assert archimedes_stats([], {})['citations']['total'] == 0
+    
+    def test_citation_statistics(self):
+        """Test per-dataset citation statistics and h-index"""
+        papers = [{'cited_by_count': c, 'year': y} for c, y in [(10, 2000), (8, 2000), (5, 2010), (4, None), (3, 2010)]]
+        stats = citation_statistics(papers)
+        assert stats['total_papers'] == 5
+        assert stats['average_citations'] == 6.0
+        assert stats['median_citations'] == 5.0
+        assert stats['h_index'] == 4
+        assert stats['i10_index'] == 1
+        assert stats['year_histogram'] == {'years': [2000, 2010], 'papers': [2, 2]}
+        assert citation_statistics([])['h_index'] == 0
+        assert citation_statistics({'broken': True})['total_papers'] == 0
+
+
+class TestCitationGraph:
+    """Test the CSR citation graph engine"""
+    
+    @pytest.fixture
+    def graph(self):
+        datasets = {
+            'sm': [
+                {'id': 'W1', 'title': 'A', 'year': 1980},
+                {'id': 'W2', 'title': 'B', 'year': 1990, 'referenced_works': ['W1', 'W9']},
+            ],
+            'vk': [
+                {'id': 'W2', 'title': 'B', 'year': 1990},
+                {'id': 'W3', 'title': 'C', 'year': 2000, 'referenced_works': ['W2']},
+            ],
+            'other': [{'id': 'W4', 'title': 'D'}],
+        }
+        return CitationGraph.from_datasets(datasets, {'sm': ['Shepard'], 'vk': ['Vandenberg']})
+    
+    def test_structure_and_degrees(self, graph):
+        """Test nodes, deduplicated edges and degree distributions"""
+        # W1->S, W2->S, W2->W1, W2->V, W3->V, W3->W2 (W9 is outside the graph)
+        assert graph.summary() == {'nodes': 6, 'edges': 6, 'seeds': 2, 'components': 2}
+        assert graph.node(graph.ids['w2'])['datasets'] == ['sm', 'vk']
+        assert graph.degree_distributions['out'] == {'degrees': [0, 1, 2, 3], 'nodes': [3, 1, 1, 1]}
+        assert graph.in_degrees[graph.ids['seed:shepard']] == 2
+    
+    def test_pagerank(self, graph):
+        """Test PageRank sums to one and ranks the most cited seed first"""
+        assert abs(graph.pagerank.sum() - 1.0) < 1e-9
+        assert graph.top_pagerank(1)[0]['id'] == 'seed:shepard'
+    
+    def test_components_and_neighborhood(self, graph):
+        """Test components and k-hop neighborhoods by direction"""
+        components = graph.components()
+        assert components['count'] == 2
+        assert [c['size'] for c in components['largest']] == [5, 1]
+        
+        citing = graph.neighborhood('seed:shepard', hops=1, direction='in')
+        assert sorted(n['id'] for n in citing['nodes']) == ['w1', 'w2']
+        two_hops = graph.neighborhood('W1', hops=2, direction='in')
+        assert [(n['id'], n['hops']) for n in two_hops['nodes']] == [('w2', 1), ('w3', 2)]
+        assert graph.neighborhood('W4', hops=3)['total'] == 0
+        with pytest.raises(KeyError):
+            graph.neighborhood('W404')
+    
+    def test_dataset_sets(self):
+        """Test intersections, unions and differences over dataset bitsets"""
+        sets = DatasetSets({
+            'sm': [{'doi': '10.1/a', 'title': 'A'}, {'title': 'B'}, {'title': 'C'}],
+            'vk': [{'doi': '10.1/a', 'title': 'A (dup)'}, {'title': 'C'}, {'title': 'D'}],
+            'broken': {'papers': 'not a list'},
+        })
+        titles = lambda bitset: [p['title'] for p in sets.papers(sets.positions(bitset))]
+        assert titles(sets.evaluate('intersection', ['sm', 'vk'])) == ['A', 'C']
+        assert titles(sets.evaluate('union', ['sm', 'vk'])) == ['A', 'B', 'C', 'D']
+        assert titles(sets.evaluate('difference', ['vk', 'sm'])) == ['D']
+        assert titles(sets.evaluate('difference', ['sm'])) == ['A', 'B', 'C']
+        assert sets.counts() == {'sm': 3, 'vk': 3}
+        with pytest.raises(KeyError):
+            sets.evaluate('union', ['sm', 'missing'])
+        with pytest.raises(ValueError):
+            sets.evaluate('xor', ['sm'])
+
+
+class TestRateLimiting:
+    """Test fetch-script rate limiting and retry scheduling"""
+    
+    @pytest.fixture
+    def clock(self):
+        class FakeClock:
+            now = 0.0
+            
+            def __call__(self):
+                return self.now
+            
+            def sleep(self, seconds):
+                self.now += seconds
+        return FakeClock()
+    
+    def test_token_bucket_allows_burst_then_paces(self, clock):
+        """Test burst requests go out immediately and later ones wait 1/rate"""
+        bucket = TokenBucket(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+        assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert bucket.acquire() == pytest.approx(0.5)
+        clock.now += 10  # idle time refills at most `burst` tokens
+        assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+        assert bucket.acquire() > 0
+    
+    def test_token_bucket_rate_change(self, clock):
+        """Test set_rate changes pacing for later requests"""
+        bucket = TokenBucket(rate=1, burst=1, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+        bucket.set_rate(4)
+        assert bucket.acquire() == pytest.approx(0.25)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+    
+    def test_classify_fetch_error(self):
+        """Test fetch errors map onto check_rate_limit's categories"""
+        class TranscriptsDisabled(Exception):
+            pass
+        
+        class NoTranscriptFound(Exception):
+            pass
+        
+        assert classify_fetch_error(TranscriptsDisabled()) == 'disabled'
+        assert classify_fetch_error(NoTranscriptFound()) == 'not_found'
+        assert classify_fetch_error(Exception(
+            "Could not retrieve a transcript: YouTube is blocking requests from your IP")) == 'ip_blocked'
+        assert classify_fetch_error(Exception("Could not retrieve a transcript for abc")) == 'failed'
+        assert classify_fetch_error(ValueError("boom")) == 'error'
+    
+    def test_adaptive_rate_aimd_with_cooldown(self, clock):
+        """Test additive increase, multiplicative decrease and the cool-down window"""
+        log = []
+        bucket = TokenBucket(rate=1.0, burst=1, clock=clock, sleep=clock.sleep)
+        controller = AdaptiveRateController(bucket, min_rate=0.1, max_rate=1.5, increase=0.1,
+                                            decrease=0.5, cooldown=30, clock=clock, log=log.append)
+        for _ in range(3):
+            controller.record('success')
+        assert controller.rate == pytest.approx(1.3)
+        controller.record('disabled')  # server answered: still counts as healthy
+        assert controller.rate == pytest.approx(1.4)
+        controller.record('failed')  # ambiguous failure: no change
+        assert controller.rate == pytest.approx(1.4)
+        
+        controller.record('ip_blocked')
+        assert controller.rate == pytest.approx(0.7)
+        controller.record('ip_blocked')  # same block, still cooling down
+        controller.record('success')
+        assert controller.rate == pytest.approx(0.7)
+        
+        clock.now += 31
+        controller.record('success')
+        assert controller.rate == pytest.approx(0.8)
+        for _ in range(20):
+            controller.record('success')
+        assert controller.rate == pytest.approx(1.5)
+        
+        for _ in range(10):
+            controller.record('ip_blocked')
+            clock.now += 31
+        assert controller.rate == pytest.approx(0.1)
+        assert any('ip_blocked' in line for line in log)
+    
+    def test_retry_schedule_parks_permanent_failures(self):
+        """Test disabled transcripts are parked for weeks, transient errors back off per run"""
+        now = datetime(2026, 1, 1)
+        disabled = schedule_failure({'transcript_status': 'error'}, 'disabled', now=now)
+        assert not is_eligible(disabled, now + timedelta(days=7))
+        assert is_eligible(disabled, now + timedelta(days=31))
+        
+        entry, delays = None, []
+        for _ in range(4):
+            entry = schedule_failure({'transcript_status': 'error'}, 'ip_blocked', previous=entry, now=now)
+            delays.append(datetime.fromisoformat(entry['transcript_next_eligible_at']) - now)
+        assert entry['transcript_failures'] == 4
+        assert delays == [timedelta(hours=h) for h in (1, 2, 4, 8)]
+        
+        # A success resets the count; legacy entries without a schedule are eligible
+        fresh = schedule_failure({'transcript_status': 'error'}, 'failed',
+                                 previous={'transcript_status': 'success'}, now=now)
+        assert fresh['transcript_failures'] == 1
+        assert is_eligible({'transcript_status': 'error'}, now)
+
+
+class TestTranscriptStore:
+    """Test the SQLite transcript store used by the fetch scripts"""
+    
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = TranscriptStore(str(tmp_path / 'podcasts.db'))
+        yield store
+        store.close()
+    
+    def test_upsert_replaces_in_place(self, store, tmp_path):
+        """Test upserts replace by youtube_id and export keeps first-seen order"""
+        store.upsert({'youtube_id': 'a', 'transcript_status': 'error'})
+        store.upsert({'youtube_id': 'b', 'transcript_status': 'success', 'transcript': 'hi'})
+        store.upsert({'youtube_id': 'a', 'transcript_status': 'success', 'transcript': 'again'})
+        assert len(store) == 2
+        assert store.get('a')['transcript'] == 'again'
+        assert store.get('missing') is None
+        assert store.ids_with_status('success') == {'a', 'b'}
+        
+        output = tmp_path / 'podcasts.json'
+        assert store.export_json(str(output)) == 2
+        assert [e['youtube_id'] for e in json.loads(output.read_text())] == ['a', 'b']
+    
+    def test_deferred_ids_follow_retry_schedule(self, store):
+        """Test failed entries are deferred until their next eligible time"""
+        now = datetime(2026, 1, 1)
+        store.upsert(schedule_failure({'youtube_id': 'off', 'transcript_status': 'error'}, 'disabled', now=now))
+        store.upsert(schedule_failure({'youtube_id': 'blk', 'transcript_status': 'error'}, 'ip_blocked', now=now))
+        store.upsert({'youtube_id': 'old', 'transcript_status': 'error'})
+        assert store.deferred_ids(now) == {'off': 'disabled', 'blk': 'ip_blocked'}
+        assert store.deferred_ids(now + timedelta(days=2)) == {'off': 'disabled'}
+        assert store.status_counts() == {'error': 3}
+    
+    def test_seed_from_existing_export(self, store, tmp_path):
+        """Test the store imports podcasts.json once, when empty"""
+        output = tmp_path / 'podcasts.json'
+        output.write_text(json.dumps([{'youtube_id': 'x', 'transcript_status': 'success'}, {'title': 'no id'}]))
+        assert store.seed_from(str(output)) == 1
+        assert store.seed_from(str(output)) == 0
+        assert 'x' in store
@@ -0,0 +1,128 @@
+"""
+Keyed transcript store for the fetch scripts
+Episodes live in a SQLite table keyed by youtube_id, so recording a fetch is
+one indexed upsert (committed immediately, so an interrupted run loses
+nothing) instead of a list scan plus a rewrite of podcasts.json. Status and
+retry-schedule columns answer "which ids are done / waiting" without
+decoding any transcripts. export_json() writes the list layout app.py reads,
+in first-seen order.
+"""
+import json
+import os
+import sqlite3
+
+from persistence import atomic_write_text
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS episodes (
+    youtube_id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL UNIQUE,
+    status TEXT,
+    failure_class TEXT,
+    next_eligible_at TEXT,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS episodes_status ON episodes (status);
+"""
+
+
+def store_path_for(output_file):
+    """Database path kept next to a JSON export (flask_data/podcasts.json -> flask_data/podcasts.db)"""
+    return os.path.splitext(output_file)[0] + '.db'
+
+
+class TranscriptStore:
+    """Episode entries keyed by youtube_id"""
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+
+    def upsert(self, entry):
+        """Insert or replace the entry for entry['youtube_id'] (keeps its export position)"""
+        self.upsert_many([entry])
+
+    def upsert_many(self, entries):
+        """Upsert several entries in one transaction"""
+        with self.db:
+            for entry in entries:
+                self.db.execute(
+                    """INSERT INTO episodes (youtube_id, position, status, failure_class, next_eligible_at, entry)
+                       VALUES (?, (SELECT COALESCE(MAX(position), -1) + 1 FROM episodes), ?, ?, ?, ?)
+                       ON CONFLICT (youtube_id) DO UPDATE SET
+                           status = excluded.status,
+                           failure_class = excluded.failure_class,
+                           next_eligible_at = excluded.next_eligible_at,
+                           entry = excluded.entry""",
+                    (entry['youtube_id'], entry.get('transcript_status'),
+                     entry.get('transcript_failure_class'), entry.get('transcript_next_eligible_at'),
+                     json.dumps(entry, ensure_ascii=False)))
+
+    def get(self, youtube_id):
+        """Entry for youtube_id, or None"""
+        row = self.db.execute("SELECT entry FROM episodes WHERE youtube_id = ?", (youtube_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def ids_with_status(self, status):
+        """Set of youtube_ids whose transcript_status is status"""
+        rows = self.db.execute("SELECT youtube_id FROM episodes WHERE status = ?", (status,))
+        return {youtube_id for youtube_id, in rows}
+
+    def status_counts(self):
+        """Number of episodes per transcript_status"""
+        return dict(self.db.execute("SELECT status, COUNT(*) FROM episodes GROUP BY status"))
+
+    def deferred_ids(self, now):
+        """Map failed ids whose next_eligible_at is after now (a datetime) to their failure class"""
+        rows = self.db.execute(
+            """SELECT youtube_id, COALESCE(failure_class, 'error') FROM episodes
+               WHERE status IS NOT 'success' AND next_eligible_at > ?""",
+            (now.isoformat(),))
+        return dict(rows)
+
+    def entries(self):
+        """Every entry, in export order"""
+        for entry, in self.db.execute("SELECT entry FROM episodes ORDER BY position"):
+            yield json.loads(entry)
+
+    def import_json(self, filepath):
+        """Upsert the entries of a podcasts.json-style list; returns how many were imported"""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        entries = [entry for entry in data if isinstance(entry, dict) and entry.get('youtube_id')]
+        if len(entries) < len(data):
+            print(f"Warning: skipping {len(data) - len(entries)} entries without a youtube_id in {filepath}")
+        self.upsert_many(entries)
+        return len(entries)
+
+    def seed_from(self, filepath):
+        """Import filepath if the store is still empty (first run after switching to the store)"""
+        if len(self) or not os.path.exists(filepath):
+            return 0
+        return self.import_json(filepath)
+
+    def export_json(self, filepath):
+        """Write every entry to filepath as the JSON list app.py loads (atomically)"""
+        entries = list(self.entries())
+        atomic_write_text(filepath, json.dumps(entries, indent=2, ensure_ascii=False))
+        return len(entries)
+
+    def __len__(self):
+        return self.db.execute("SELECT COUNT(*) FROM episodes").fetchone()[0]
+
+    def __contains__(self, youtube_id):
+        return self.db.execute("SELECT 1 FROM episodes WHERE youtube_id = ?", (youtube_id,)).fetchone() is not None
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        return f"TranscriptStore({self.path!r}, episodes={len(self)})"
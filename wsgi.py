@@ -0,0 +1,8 @@
+"""
+WSGI entry point: gunicorn -w 4 -b 0.0.0.0:5000 wsgi:app
+Site data is loaded and templates are warmed when the worker imports this
+module, before it accepts requests (importing app alone does neither).
+"""
+from app import create_app
+
+app = create_app()